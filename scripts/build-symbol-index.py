@@ -9,7 +9,8 @@ Creates three artifacts for agent lookup:
 
 Supports two discovery modes:
   1) Runtime mode (`--package`): imports modules and uses inspect/signatures.
-  2) Source mode (`--source`): parses .py files with AST (no installs needed).
+  2) Source mode (`--source`): parses .py files statically (no installs needed).
+     Uses tree-sitter-python when available, otherwise the stdlib `ast`.
 
 Usage:
     # Runtime mode (installed package)
@@ -17,23 +18,63 @@ Usage:
 
     # Source mode (no install)
     python build-symbol-index.py --source /path/to/library/src/mypkg
+
+Optional dependencies:
+    tree_sitter + tree_sitter_python  (faster source-mode parsing)
+    orjson                            (faster JSONL serialisation)
+    pip install tree_sitter tree_sitter_python orjson
 """
 
 from __future__ import annotations
 
 import argparse
 import ast
+import hashlib
 import importlib
 import inspect
+import io
 import json
+import linecache
+import os
 import pkgutil
 import sys
-from dataclasses import asdict, dataclass
+import time
+import types
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, fields
+from functools import partial
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
+
+tree_sitter: Any = None
+TS_PYTHON: Any = None
+
+try:
+    import tree_sitter as _tree_sitter
+    import tree_sitter_python as _tree_sitter_python
+
+    tree_sitter = _tree_sitter
+    TS_PYTHON = tree_sitter.Language(_tree_sitter_python.language())
+    HAS_TREE_SITTER = True
+except (ImportError, TypeError, ValueError):
+    HAS_TREE_SITTER = False
+
+try:
+    import orjson
+
+    def dumps_record(data: dict[str, Any]) -> bytes:
+        return orjson.dumps(data)
+
+except ImportError:
+
+    def dumps_record(data: dict[str, Any]) -> bytes:
+        # Same bytes as orjson: compact separators, UTF-8, no ASCII escaping.
+        return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode(
+            "utf-8"
+        )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SymbolRecord:
     symbol: str
     kind: str
@@ -45,6 +86,14 @@ class SymbolRecord:
     verification: str  # runtime | ast
 
 
+_RECORD_FIELDS = tuple(f.name for f in fields(SymbolRecord))
+
+
+def record_to_dict(record: SymbolRecord) -> dict[str, Any]:
+    # SymbolRecord only has primitive fields; no need for asdict's deep copy.
+    return {name: getattr(record, name) for name in _RECORD_FIELDS}
+
+
 def first_nonempty_line(doc: str | None, limit: int = 220) -> str:
     if not doc:
         return ""
@@ -57,41 +106,220 @@ def first_nonempty_line(doc: str | None, limit: int = 220) -> str:
     return ""
 
 
+# Function attributes that make inspect.signature deviate from __code__.
+_SIGNATURE_OVERRIDES = ("__wrapped__", "__signature__", "_partialmethod")
+
+
+def _format_runtime_param(
+    name: str, annotations: dict[str, Any], default: Any = inspect.Parameter.empty
+) -> str:
+    token = name
+    if name in annotations:
+        token += ": " + inspect.formatannotation(annotations[name])
+        if default is not inspect.Parameter.empty:
+            token += " = " + repr(default)
+    elif default is not inspect.Parameter.empty:
+        token += "=" + repr(default)
+    return token
+
+
+def signature_from_code(name: str, fn: types.FunctionType) -> str:
+    """Render ``str(inspect.signature(fn))`` from __code__ and __defaults__."""
+    code = fn.__code__
+    varnames = code.co_varnames
+    pos_count = code.co_argcount
+    posonly_count = code.co_posonlyargcount
+    kwonly_count = code.co_kwonlyargcount
+    defaults = fn.__defaults__ or ()
+    kwdefaults = fn.__kwdefaults__ or {}
+    annotations = fn.__annotations__
+    default_start = pos_count - len(defaults)
+
+    tokens: list[str] = []
+    for idx in range(pos_count):
+        if idx >= default_start:
+            token = _format_runtime_param(
+                varnames[idx], annotations, defaults[idx - default_start]
+            )
+        else:
+            token = _format_runtime_param(varnames[idx], annotations)
+        tokens.append(token)
+        if idx + 1 == posonly_count:
+            tokens.append("/")
+
+    next_name = pos_count + kwonly_count
+    if code.co_flags & inspect.CO_VARARGS:
+        tokens.append("*" + _format_runtime_param(varnames[next_name], annotations))
+        next_name += 1
+    elif kwonly_count:
+        tokens.append("*")
+
+    for kwname in varnames[pos_count : pos_count + kwonly_count]:
+        tokens.append(
+            _format_runtime_param(
+                kwname, annotations, kwdefaults.get(kwname, inspect.Parameter.empty)
+            )
+        )
+
+    if code.co_flags & inspect.CO_VARKEYWORDS:
+        tokens.append("**" + _format_runtime_param(varnames[next_name], annotations))
+
+    rendered = f"{name}({', '.join(tokens)})"
+    if "return" in annotations:
+        rendered += " -> " + inspect.formatannotation(annotations["return"])
+    return rendered
+
+
 def safe_signature_runtime(name: str, obj: Any) -> str:
     try:
+        if type(obj) is types.FunctionType and not any(
+            attr in obj.__dict__ for attr in _SIGNATURE_OVERRIDES
+        ):
+            return signature_from_code(name, obj)
         return f"{name}{inspect.signature(obj)}"
     except (TypeError, ValueError):
         return f"{name}(...)"
 
 
+# Per-file caches for runtime source attribution. Thousands of symbols share a
+# few hundred files, so resolve each file (and index its classes) only once.
+_SOURCE_PATHS: dict[str, str] = {}
+_DISPLAY_PATHS: dict[tuple[str, Path | None], str] = {}
+_SOURCE_LINES: dict[str, list[str]] = {}
+_CLASS_LINES: dict[str, dict[str, int]] = {}
+
+
+def _index_class_lines(
+    node: ast.AST, stack: list[str], index: dict[str, int]
+) -> None:
+    # Same traversal and qualname scheme as inspect's class finder; the first
+    # match in document order wins and decorated classes start at the decorator.
+    for child in ast.iter_child_nodes(node):
+        if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            _index_class_lines(child, stack + [child.name, "<locals>"], index)
+        elif isinstance(child, ast.ClassDef):
+            qualname = ".".join(stack + [child.name])
+            if child.decorator_list:
+                index.setdefault(qualname, child.decorator_list[0].lineno)
+            else:
+                index.setdefault(qualname, child.lineno)
+            _index_class_lines(child, stack + [child.name], index)
+        else:
+            _index_class_lines(child, stack, index)
+
+
+def class_line_index(file_path: str, lines: list[str]) -> dict[str, int]:
+    index = _CLASS_LINES.get(file_path)
+    if index is None:
+        index = {}
+        try:
+            _index_class_lines(ast.parse("".join(lines)), [], index)
+        except (SyntaxError, ValueError):
+            pass
+        _CLASS_LINES[file_path] = index
+    return index
+
+
+def safe_source_line_runtime(obj: Any) -> int | None:
+    """Equivalent of ``inspect.getsourcelines(obj)[1]`` with per-file caching."""
+    try:
+        target = inspect.unwrap(obj)
+        file_path = inspect.getsourcefile(target)
+    except (TypeError, ValueError):
+        return None
+
+    lines = _SOURCE_LINES.get(file_path) if file_path else None
+    if lines is None and file_path:
+        lines = _SOURCE_LINES[file_path] = linecache.getlines(file_path)
+    if not file_path or not lines:
+        # Pseudo-files ("<string>") or loader-provided sources.
+        try:
+            return inspect.getsourcelines(obj)[1]
+        except (TypeError, OSError):
+            return None
+
+    if inspect.isclass(target):
+        return class_line_index(file_path, lines).get(target.__qualname__)
+    code = getattr(target, "__code__", None)
+    if code is None:
+        return None
+    return code.co_firstlineno
+
+
 def safe_source_runtime(
     obj: Any, root_hint: Path | None = None
 ) -> tuple[str, int | None]:
     source_file = "(unknown)"
-    source_line: int | None = None
     try:
-        file_path = inspect.getsourcefile(obj) or inspect.getfile(obj)
+        file_path = inspect.getfile(obj)
+        if file_path not in _SOURCE_PATHS:
+            _SOURCE_PATHS[file_path] = inspect.getsourcefile(obj) or file_path
+        file_path = _SOURCE_PATHS[file_path]
         if file_path:
-            p = Path(file_path).resolve()
-            if root_hint is not None:
-                try:
-                    source_file = str(p.relative_to(root_hint))
-                except ValueError:
-                    source_file = str(p)
-            else:
-                source_file = str(p)
+            key = (file_path, root_hint)
+            if key not in _DISPLAY_PATHS:
+                p = Path(file_path).resolve()
+                if root_hint is not None:
+                    try:
+                        _DISPLAY_PATHS[key] = str(p.relative_to(root_hint))
+                    except ValueError:
+                        _DISPLAY_PATHS[key] = str(p)
+                else:
+                    _DISPLAY_PATHS[key] = str(p)
+            source_file = _DISPLAY_PATHS[key]
     except (TypeError, OSError):
         pass
 
-    try:
-        source_line = inspect.getsourcelines(obj)[1]
-    except (TypeError, OSError):
-        source_line = None
+    return source_file, safe_source_line_runtime(obj)
+
+
+def public_module_members(mod: Any) -> list[tuple[str, Any]]:
+    namespace = getattr(mod, "__dict__", None)
+    if namespace is not None and "__dir__" not in namespace:
+        return [
+            (name, obj)
+            for name, obj in list(namespace.items())
+            if not name.startswith("_")
+        ]
+
+    # A module-level __dir__ decides what is listed, as with
+    # inspect.getmembers: it may hide names or add lazily attached ones
+    # (module-level __getattr__, e.g. lazy_loader) that only getattr() reaches.
+    namespace = namespace or {}
+    members = []
+    for name in dir(mod):
+        if name.startswith("_"):
+            continue
+        if name in namespace:
+            members.append((name, namespace[name]))
+            continue
+        try:
+            members.append((name, getattr(mod, name)))
+        except AttributeError:
+            continue
+    return members
 
-    return source_file, source_line
+
+def public_class_functions(cls: type) -> list[tuple[str, types.FunctionType]]:
+    seen: set[str] = set()
+    functions: list[tuple[str, types.FunctionType]] = []
+    for klass in cls.__mro__:
+        for name, value in vars(klass).items():
+            if name in seen:
+                continue
+            seen.add(name)
+            if name.startswith("_"):
+                continue
+            if isinstance(value, staticmethod):
+                value = value.__func__
+            if isinstance(value, types.FunctionType):
+                functions.append((name, value))
+    return functions
 
 
-def walk_installed_modules(package_name: str, max_depth: int) -> list[str]:
+def walk_installed_modules(
+    package_name: str, max_depth: int
+) -> tuple[list[str], types.ModuleType]:
     modules: list[str] = []
 
     try:
@@ -103,20 +331,29 @@ def walk_installed_modules(package_name: str, max_depth: int) -> list[str]:
     modules.append(package_name)
     pkg_path = getattr(pkg, "__path__", None)
     if pkg_path is None:
-        return modules
-
-    base_depth = package_name.count(".") + 1
-    for importer, modname, ispkg in pkgutil.walk_packages(
-        path=pkg_path,
-        prefix=package_name + ".",
-        onerror=lambda name: None,
-    ):
-        depth = modname.count(".") - base_depth + 1
+        return modules, pkg
+
+    # Same preorder as pkgutil.walk_packages, but only subpackages whose
+    # children are within max_depth get imported.
+    seen_paths: set[str] = set()
+
+    def walk(path: list[str], prefix: str, depth: int) -> None:
         if depth > max_depth:
-            continue
-        modules.append(modname)
+            return
+        for _, modname, ispkg in pkgutil.iter_modules(path, prefix):
+            modules.append(modname)
+            if not ispkg or depth == max_depth:
+                continue
+            try:
+                sub_path = getattr(importlib.import_module(modname), "__path__", None)
+            except Exception:
+                continue
+            sub_path = [p for p in sub_path or [] if p not in seen_paths]
+            seen_paths.update(sub_path)
+            walk(sub_path, modname + ".", depth + 1)
 
-    return modules
+    walk(list(pkg_path), package_name + ".", 1)
+    return modules, pkg
 
 
 def collect_runtime_records(
@@ -127,108 +364,127 @@ def collect_runtime_records(
     records: dict[str, SymbolRecord] = {}
     import_failures: list[str] = []
 
-    modules = walk_installed_modules(package_name, max_depth)
+    modules, pkg = walk_installed_modules(package_name, max_depth)
 
     root_hint: Path | None = None
-    try:
-        pkg = importlib.import_module(package_name)
-        pkg_file = getattr(pkg, "__file__", None)
-        if pkg_file:
-            root_hint = Path(pkg_file).resolve().parent
-    except Exception:
-        root_hint = None
+    pkg_file = getattr(pkg, "__file__", None)
+    if pkg_file:
+        root_hint = Path(pkg_file).resolve().parent
 
-    for modname in sorted(modules):
-        try:
-            mod = importlib.import_module(modname)
-        except Exception as exc:
-            import_failures.append(f"{modname}: {exc}")
-            continue
+    # Most members share a handful of __module__ strings; test each one once.
+    pkg_prefix = package_name + "."
+    in_package: dict[str, bool] = {}
 
-        for name, obj in inspect.getmembers(mod):
-            if name.startswith("_"):
+    def from_package(module_name: str) -> bool:
+        ok = in_package.get(module_name)
+        if ok is None:
+            ok = module_name == package_name or module_name.startswith(pkg_prefix)
+            in_package[module_name] = ok
+        return ok
+
+    for modname in sorted(modules):
+        # The walk already imported every subpackage; skip the finders for those.
+        mod = sys.modules.get(modname)
+        if mod is None:
+            try:
+                mod = importlib.import_module(modname)
+            except Exception as exc:
+                import_failures.append(f"{modname}: {exc}")
                 continue
 
+        for name, obj in public_module_members(mod):
+            if type(obj) is types.FunctionType:
+                kind = "function"
+            elif isinstance(obj, type):
+                kind = "class"
+            else:
+                continue
             obj_module = getattr(obj, "__module__", "") or ""
-            if not obj_module.startswith(package_name):
+            if not from_package(obj_module):
                 continue
 
-            if inspect.isfunction(obj):
-                symbol = f"{modname}.{name}"
-                source_file, source_line = safe_source_runtime(obj, root_hint)
-                records[symbol] = SymbolRecord(
-                    symbol=symbol,
-                    kind="function",
-                    module=modname,
-                    signature=safe_signature_runtime(name, obj),
-                    summary=first_nonempty_line(inspect.getdoc(obj)),
-                    source_file=source_file,
-                    source_line=source_line,
-                    verification="runtime",
-                )
+            symbol = f"{modname}.{name}"
+            source_file, source_line = safe_source_runtime(obj, root_hint)
+            records[symbol] = SymbolRecord(
+                symbol=symbol,
+                kind=kind,
+                module=modname,
+                signature=safe_signature_runtime(name, obj),
+                summary=first_nonempty_line(inspect.getdoc(obj)),
+                source_file=source_file,
+                source_line=source_line,
+                verification="runtime",
+            )
+
+            if kind != "class" or not include_methods:
+                continue
 
-            elif inspect.isclass(obj):
-                symbol = f"{modname}.{name}"
-                source_file, source_line = safe_source_runtime(obj, root_hint)
-                records[symbol] = SymbolRecord(
-                    symbol=symbol,
-                    kind="class",
+            for mname, mobj in public_class_functions(obj):
+                method_module = getattr(mobj, "__module__", "") or ""
+                if not from_package(method_module):
+                    continue
+                msymbol = f"{modname}.{name}.{mname}"
+                msource_file, msource_line = safe_source_runtime(mobj, root_hint)
+                records[msymbol] = SymbolRecord(
+                    symbol=msymbol,
+                    kind="method",
                     module=modname,
-                    signature=safe_signature_runtime(name, obj),
-                    summary=first_nonempty_line(inspect.getdoc(obj)),
-                    source_file=source_file,
-                    source_line=source_line,
+                    signature=safe_signature_runtime(mname, mobj),
+                    summary=first_nonempty_line(inspect.getdoc(mobj)),
+                    source_file=msource_file,
+                    source_line=msource_line,
                     verification="runtime",
                 )
 
-                if not include_methods:
-                    continue
+    return sorted(records.values(), key=lambda r: r.symbol), import_failures
 
-                for mname, mobj in inspect.getmembers(
-                    obj, predicate=inspect.isfunction
-                ):
-                    if mname.startswith("_"):
-                        continue
-                    method_module = getattr(mobj, "__module__", "") or ""
-                    if not method_module.startswith(package_name):
-                        continue
-                    msymbol = f"{modname}.{name}.{mname}"
-                    msource_file, msource_line = safe_source_runtime(mobj, root_hint)
-                    records[msymbol] = SymbolRecord(
-                        symbol=msymbol,
-                        kind="method",
-                        module=modname,
-                        signature=safe_signature_runtime(mname, mobj),
-                        summary=first_nonempty_line(inspect.getdoc(mobj)),
-                        source_file=msource_file,
-                        source_line=msource_line,
-                        verification="runtime",
-                    )
 
-    return sorted(records.values(), key=lambda r: r.symbol), import_failures
+_INIT_SUFFIX = os.sep + "__init__.py"
 
 
-def module_name_from_source_path(pkg_root: Path, py_path: Path) -> str:
-    rel = py_path.relative_to(pkg_root)
-    pkg_name = pkg_root.name
-    if rel.name == "__init__.py":
-        if rel.parent == Path("."):
-            return pkg_name
-        return pkg_name + "." + ".".join(rel.parent.parts)
-    return pkg_name + "." + ".".join(rel.with_suffix("").parts)
+def source_names(
+    py_path: str, pkg_name: str, root_prefix: str, parent_prefix: str
+) -> tuple[str, str]:
+    """Return (dotted module name, path relative to the package parent).
+
+    Prefixes end with os.sep; plain string slicing avoids building several
+    Path objects per file on large trees.
+    """
+    rel = py_path[len(root_prefix) :]
+    if rel == "__init__.py":
+        module = pkg_name
+    elif rel.endswith(_INIT_SUFFIX):
+        module = pkg_name + "." + rel[: -len(_INIT_SUFFIX)].replace(os.sep, ".")
+    else:
+        module = pkg_name + "." + rel[:-3].replace(os.sep, ".")
+    return module, py_path[len(parent_prefix) :]
 
 
-def source_file_for_record(pkg_root: Path, py_path: Path) -> str:
-    return str(py_path.relative_to(pkg_root.parent))
+_UNPARSE_CACHE: dict[object, str] = {}
+_UNPARSE_CACHE_MAX = 4096
 
 
 def _default_to_text(node: ast.AST | None) -> str:
     if node is None:
         return "None"
-    try:
-        return ast.unparse(node)
-    except Exception:
-        return "..."
+    if isinstance(node, ast.Constant):
+        value = node.value
+        # repr() matches ast.unparse for these; strings and floats do not always.
+        if value is None or type(value) in (bool, int):
+            return repr(value)
+        key: object = (type(value), value, node.kind)
+    else:
+        key = ast.dump(node)
+    text = _UNPARSE_CACHE.get(key)
+    if text is None:
+        try:
+            text = ast.unparse(node)
+        except Exception:
+            return "..."
+        if len(_UNPARSE_CACHE) >= _UNPARSE_CACHE_MAX:
+            _UNPARSE_CACHE.popitem()
+        _UNPARSE_CACHE[key] = text
+    return text
 
 
 def signature_from_ast(
@@ -278,93 +534,473 @@ def signature_from_ast(
     return f"{fn_name}({', '.join(tokens)})"
 
 
-def collect_ast_records(
-    pkg_root: Path, include_methods: bool
-) -> tuple[list[SymbolRecord], list[str]]:
-    records: dict[str, SymbolRecord] = {}
-    parse_failures: list[str] = []
+_FN_TYPES = (ast.FunctionDef, ast.AsyncFunctionDef)
+
+
+def _ast_function_records(
+    node: ast.FunctionDef | ast.AsyncFunctionDef,
+    module: str,
+    source_rel: str,
+    records: list[SymbolRecord],
+    include_methods: bool,
+) -> None:
+    if node.name.startswith("_"):
+        return
+    records.append(
+        SymbolRecord(
+            symbol=f"{module}.{node.name}",
+            kind="function",
+            module=module,
+            signature=signature_from_ast(node.name, node.args),
+            summary=first_nonempty_line(ast.get_docstring(node)),
+            source_file=source_rel,
+            source_line=node.lineno,
+            verification="ast",
+        )
+    )
+
+
+def _ast_class_records(
+    node: ast.ClassDef,
+    module: str,
+    source_rel: str,
+    records: list[SymbolRecord],
+    include_methods: bool,
+) -> None:
+    if node.name.startswith("_"):
+        return
+
+    # One pass over the body: the first __init__ plus the public methods.
+    init_node: ast.FunctionDef | ast.AsyncFunctionDef | None = None
+    method_nodes: list[ast.FunctionDef | ast.AsyncFunctionDef] = []
+    for cnode in node.body:
+        if not isinstance(cnode, _FN_TYPES):
+            continue
+        if not cnode.name.startswith("_"):
+            method_nodes.append(cnode)
+        elif init_node is None and cnode.name == "__init__":
+            init_node = cnode
+
+    if init_node is not None:
+        class_sig = signature_from_ast(
+            node.name, init_node.args, drop_first_param=True
+        )
+    else:
+        class_sig = f"{node.name}(...)"
+
+    records.append(
+        SymbolRecord(
+            symbol=f"{module}.{node.name}",
+            kind="class",
+            module=module,
+            signature=class_sig,
+            summary=first_nonempty_line(ast.get_docstring(node)),
+            source_file=source_rel,
+            source_line=node.lineno,
+            verification="ast",
+        )
+    )
+
+    if not include_methods:
+        return
+
+    for cnode in method_nodes:
+        records.append(
+            SymbolRecord(
+                symbol=f"{module}.{node.name}.{cnode.name}",
+                kind="method",
+                module=module,
+                signature=signature_from_ast(
+                    cnode.name, cnode.args, drop_first_param=True
+                ),
+                summary=first_nonempty_line(ast.get_docstring(cnode)),
+                source_file=source_rel,
+                source_line=cnode.lineno,
+                verification="ast",
+            )
+        )
+
+
+# Top-level statement dispatch keyed by node class name.
+_AST_HANDLERS = {
+    "FunctionDef": _ast_function_records,
+    "AsyncFunctionDef": _ast_function_records,
+    "ClassDef": _ast_class_records,
+}
+
+
+def records_from_ast(
+    tree: ast.Module, module: str, source_rel: str, include_methods: bool
+) -> list[SymbolRecord]:
+    records: list[SymbolRecord] = []
+    for node in tree.body:
+        handler = _AST_HANDLERS.get(type(node).__name__)
+        if handler is not None:
+            handler(node, module, source_rel, records, include_methods)
+    return records
+
+
+_TS_PARSER: Any = None
+_TS_DEFINITION_TYPES = ("function_definition", "class_definition")
+_TS_STRING_TYPES = ("string", "concatenated_string")
 
-    for py_path in sorted(pkg_root.rglob("*.py")):
-        module = module_name_from_source_path(pkg_root, py_path)
-        source_rel = source_file_for_record(pkg_root, py_path)
 
+def _tree_sitter_parser() -> Any:
+    global _TS_PARSER
+    if _TS_PARSER is None:
+        _TS_PARSER = tree_sitter.Parser(TS_PYTHON)
+    return _TS_PARSER
+
+
+def _ts_text(node: Any) -> str:
+    return node.text.decode("utf-8", errors="replace")
+
+
+def _ts_definitions(block: Any) -> list[Any]:
+    definitions: list[Any] = []
+    for child in block.named_children:
+        if child.type == "decorated_definition":
+            child = child.child_by_field_name("definition")
+            if child is None:
+                continue
+        if child.type in _TS_DEFINITION_TYPES:
+            definitions.append(child)
+    return definitions
+
+
+def _ts_docstring(node: Any) -> str | None:
+    # Mirrors ast.get_docstring: first statement must be a plain str literal.
+    body = node.child_by_field_name("body")
+    if body is None:
+        return None
+    for stmt in body.named_children:
+        if stmt.type == "comment":
+            continue
+        if stmt.type != "expression_statement" or stmt.named_child_count != 1:
+            return None
+        expr = stmt.named_children[0]
+        if expr.type not in _TS_STRING_TYPES:
+            return None
         try:
-            src = py_path.read_text(encoding="utf-8", errors="replace")
-            tree = ast.parse(src, filename=str(py_path))
-        except Exception as exc:
-            parse_failures.append(f"{module}: {exc}")
+            value = ast.literal_eval(_ts_text(expr))
+        except (SyntaxError, ValueError):
+            return None
+        return inspect.cleandoc(value) if isinstance(value, str) else None
+    return None
+
+
+def _source_default_to_text(text: str) -> str:
+    # Normalise through ast.unparse so output matches the ast backend.
+    try:
+        return ast.unparse(ast.parse(text.strip(), mode="eval").body)
+    except Exception:
+        return "..."
+
+
+def signature_from_tree_sitter(
+    fn_name: str, params: Any, drop_first_param: bool = False
+) -> str:
+    tokens: list[str] = []
+    first = True
+
+    for param in params.named_children:
+        kind = param.type
+        if kind == "comment":
             continue
+        if kind == "typed_parameter":
+            inner = param.named_children[0]
+            if inner.type in ("list_splat_pattern", "dictionary_splat_pattern"):
+                kind = inner.type
+                param = inner
+
+        if kind in ("identifier", "typed_parameter"):
+            if not (first and drop_first_param):
+                name = param if kind == "identifier" else param.named_children[0]
+                tokens.append(_ts_text(name))
+        elif kind in ("default_parameter", "typed_default_parameter"):
+            if not (first and drop_first_param):
+                name = _ts_text(param.child_by_field_name("name"))
+                value = _ts_text(param.child_by_field_name("value"))
+                tokens.append(name + "=" + _source_default_to_text(value))
+        elif kind == "positional_separator":
+            if tokens:
+                tokens.append("/")
+        elif kind == "keyword_separator":
+            tokens.append("*")
+        elif kind == "list_splat_pattern":
+            tokens.append("*" + _ts_text(param.named_children[0]))
+        elif kind == "dictionary_splat_pattern":
+            tokens.append("**" + _ts_text(param.named_children[0]))
+        first = False
 
-        for node in tree.body:
-            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                if node.name.startswith("_"):
-                    continue
-                symbol = f"{module}.{node.name}"
-                records[symbol] = SymbolRecord(
+    return f"{fn_name}({', '.join(tokens)})"
+
+
+def records_from_tree_sitter(
+    src: str, module: str, source_rel: str, include_methods: bool
+) -> list[SymbolRecord] | None:
+    root = _tree_sitter_parser().parse(src.encode("utf-8")).root_node
+    if root.has_error:
+        # Let the ast backend report (or recover from) syntax errors.
+        return None
+
+    records: list[SymbolRecord] = []
+    for node in _ts_definitions(root):
+        name = _ts_text(node.child_by_field_name("name"))
+        if name.startswith("_"):
+            continue
+        symbol = f"{module}.{name}"
+
+        if node.type == "function_definition":
+            records.append(
+                SymbolRecord(
                     symbol=symbol,
                     kind="function",
                     module=module,
-                    signature=signature_from_ast(node.name, node.args),
-                    summary=first_nonempty_line(ast.get_docstring(node)),
+                    signature=signature_from_tree_sitter(
+                        name, node.child_by_field_name("parameters")
+                    ),
+                    summary=first_nonempty_line(_ts_docstring(node)),
                     source_file=source_rel,
-                    source_line=node.lineno,
+                    source_line=node.start_point[0] + 1,
                     verification="ast",
                 )
+            )
+            continue
 
-            elif isinstance(node, ast.ClassDef):
-                if node.name.startswith("_"):
-                    continue
+        methods = _ts_definitions(node.child_by_field_name("body"))
+        class_sig = f"{name}(...)"
+        for cnode in methods:
+            if (
+                cnode.type == "function_definition"
+                and _ts_text(cnode.child_by_field_name("name")) == "__init__"
+            ):
+                class_sig = signature_from_tree_sitter(
+                    name,
+                    cnode.child_by_field_name("parameters"),
+                    drop_first_param=True,
+                )
+                break
+
+        records.append(
+            SymbolRecord(
+                symbol=symbol,
+                kind="class",
+                module=module,
+                signature=class_sig,
+                summary=first_nonempty_line(_ts_docstring(node)),
+                source_file=source_rel,
+                source_line=node.start_point[0] + 1,
+                verification="ast",
+            )
+        )
 
-                init_node: ast.FunctionDef | ast.AsyncFunctionDef | None = None
-                for cnode in node.body:
-                    if (
-                        isinstance(cnode, (ast.FunctionDef, ast.AsyncFunctionDef))
-                        and cnode.name == "__init__"
-                    ):
-                        init_node = cnode
-                        break
-
-                if init_node is not None:
-                    class_sig = signature_from_ast(
-                        node.name, init_node.args, drop_first_param=True
-                    )
-                else:
-                    class_sig = f"{node.name}(...)"
+        if not include_methods:
+            continue
 
-                symbol = f"{module}.{node.name}"
-                records[symbol] = SymbolRecord(
-                    symbol=symbol,
-                    kind="class",
+        for cnode in methods:
+            if cnode.type != "function_definition":
+                continue
+            mname = _ts_text(cnode.child_by_field_name("name"))
+            if mname.startswith("_"):
+                continue
+            records.append(
+                SymbolRecord(
+                    symbol=f"{module}.{name}.{mname}",
+                    kind="method",
                     module=module,
-                    signature=class_sig,
-                    summary=first_nonempty_line(ast.get_docstring(node)),
+                    signature=signature_from_tree_sitter(
+                        mname,
+                        cnode.child_by_field_name("parameters"),
+                        drop_first_param=True,
+                    ),
+                    summary=first_nonempty_line(_ts_docstring(cnode)),
                     source_file=source_rel,
-                    source_line=node.lineno,
+                    source_line=cnode.start_point[0] + 1,
                     verification="ast",
                 )
+            )
 
-                if not include_methods:
-                    continue
+    return records
 
-                for cnode in node.body:
-                    if not isinstance(cnode, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                        continue
-                    if cnode.name.startswith("_"):
-                        continue
-
-                    msymbol = f"{module}.{node.name}.{cnode.name}"
-                    records[msymbol] = SymbolRecord(
-                        symbol=msymbol,
-                        kind="method",
-                        module=module,
-                        signature=signature_from_ast(
-                            cnode.name, cnode.args, drop_first_param=True
-                        ),
-                        summary=first_nonempty_line(ast.get_docstring(cnode)),
-                        source_file=source_rel,
-                        source_line=cnode.lineno,
-                        verification="ast",
-                    )
+
+# Bump when SymbolRecord fields or source-mode rendering change.
+CACHE_VERSION = "1"
+CACHE_MAX_AGE_DAYS = 30
+
+
+def _cache_key(
+    data: bytes,
+    module: str,
+    source_rel: str,
+    include_methods: bool,
+    use_tree_sitter: bool,
+) -> str:
+    # ast.unparse output can differ between Python minor versions.
+    h = hashlib.sha256(
+        f"{CACHE_VERSION}|{sys.version_info[0]}.{sys.version_info[1]}|"
+        f"{module}|{source_rel}|{include_methods:d}|{use_tree_sitter:d}|".encode()
+    )
+    h.update(data)
+    return h.hexdigest()[:16]
+
+
+_INTERNED_FIELDS = ("kind", "module", "source_file", "verification")
+
+
+def _load_cached_records(cache_path: str) -> list[SymbolRecord] | None:
+    try:
+        with open(cache_path, "rb") as f:
+            payload = json.loads(f.read())
+        os.utime(cache_path)  # keep live entries out of prune_cache
+        records = []
+        for item in payload:
+            # json.loads makes a fresh str per record; share the repeated ones.
+            for key in _INTERNED_FIELDS:
+                item[key] = sys.intern(item[key])
+            records.append(SymbolRecord(**item))
+        return records
+    except (OSError, ValueError, TypeError):
+        return None
+
+
+def _store_cached_records(cache_path: str, records: list[SymbolRecord]) -> None:
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(json.dumps([record_to_dict(r) for r in records]).encode("utf-8"))
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+def prune_cache(cache_dir: Path, max_age_days: float = CACHE_MAX_AGE_DAYS) -> None:
+    cutoff = time.time() - max_age_days * 86400
+    try:
+        entries = os.scandir(cache_dir)
+    except OSError:
+        return
+    with entries:
+        for entry in entries:
+            try:
+                if entry.is_file() and entry.stat().st_mtime < cutoff:
+                    os.remove(entry.path)
+            except OSError:
+                continue
+
+
+def parse_one_file(
+    py_path: str,
+    module: str,
+    source_rel: str,
+    include_methods: bool,
+    use_tree_sitter: bool = False,
+    cache_dir: str | None = None,
+) -> tuple[list[SymbolRecord], str | None]:
+    try:
+        with open(py_path, "rb") as f:
+            data = f.read()
+    except OSError as exc:
+        return [], f"{module}: {exc}"
+
+    cache_path = None
+    if cache_dir is not None:
+        key = _cache_key(data, module, source_rel, include_methods, use_tree_sitter)
+        cache_path = os.path.join(cache_dir, key + ".json")
+        cached = _load_cached_records(cache_path)
+        if cached is not None:
+            return cached, None
+
+    # Same text as open(..., encoding="utf-8", errors="replace"): universal newlines.
+    src = data.decode("utf-8", errors="replace")
+    if "\r" in src:
+        src = src.replace("\r\n", "\n").replace("\r", "\n")
+
+    records: list[SymbolRecord] | None = None
+    try:
+        if use_tree_sitter:
+            records = records_from_tree_sitter(
+                src, module, source_rel, include_methods
+            )
+        if records is None:
+            tree = ast.parse(src, filename=py_path)
+    except Exception as exc:
+        return [], f"{module}: {exc}"
+
+    if records is None:
+        records = records_from_ast(tree, module, source_rel, include_methods)
+    if cache_path is not None:
+        _store_cached_records(cache_path, records)
+    return records, None
+
+
+def iter_py_files(root: str) -> Iterator[str]:
+    # Like Path.rglob("*.py"), but reuses scandir's d_type instead of stat().
+    stack = [root]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(".py") and entry.is_file():
+                    yield entry.path
+
+
+def collect_ast_records(
+    pkg_root: Path,
+    include_methods: bool,
+    jobs: int = 1,
+    use_tree_sitter: bool = False,
+    cache_dir: Path | None = None,
+) -> tuple[list[SymbolRecord], list[str]]:
+    records: dict[str, SymbolRecord] = {}
+    parse_failures: list[str] = []
+
+    # Sort by path components to keep Path ordering (foo/__init__.py < foo.py).
+    py_paths = sorted(iter_py_files(str(pkg_root)), key=lambda p: p.split(os.sep))
+    pkg_name = pkg_root.name
+    root_prefix = os.path.join(str(pkg_root), "")
+    parent_prefix = os.path.join(str(pkg_root.parent), "")
+    names = [
+        source_names(p, pkg_name, root_prefix, parent_prefix) for p in py_paths
+    ]
+    modules = [module for module, _ in names]
+    source_rels = [source_rel for _, source_rel in names]
+
+    if cache_dir is not None:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+
+    parse = partial(
+        parse_one_file,
+        include_methods=include_methods,
+        use_tree_sitter=use_tree_sitter,
+        cache_dir=str(cache_dir) if cache_dir is not None else None,
+    )
+
+    if jobs > 1 and len(py_paths) > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            results = list(
+                pool.map(parse, py_paths, modules, source_rels, chunksize=16)
+            )
+    else:
+        results = list(map(parse, py_paths, modules, source_rels))
+
+    # Merge in path order so later files win on duplicate symbols, as before.
+    for file_records, failure in results:
+        if failure is not None:
+            parse_failures.append(failure)
+        for record in file_records:
+            records[record.symbol] = record
+
+    if cache_dir is not None:
+        prune_cache(cache_dir)
 
     return sorted(records.values(), key=lambda r: r.symbol), parse_failures
 
@@ -375,14 +1011,21 @@ def safe_card_filename(module: str) -> str:
 
 def write_jsonl(records: list[SymbolRecord], output_path: Path) -> None:
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    with output_path.open("w", encoding="utf-8") as f:
+    buf = bytearray()
+    with output_path.open("wb", buffering=1 << 20) as f:
         for record in records:
-            f.write(json.dumps(asdict(record), ensure_ascii=True) + "\n")
+            buf += dumps_record(record_to_dict(record))
+            buf += b"\n"
+            if len(buf) > 1 << 18:
+                f.write(buf)
+                buf.clear()
+        f.write(buf)
 
 
 def write_cards(records: list[SymbolRecord], cards_dir: Path) -> dict[str, str]:
     cards_dir.mkdir(parents=True, exist_ok=True)
 
+    # records arrive sorted by symbol, so each bucket is already in order.
     by_module: dict[str, list[SymbolRecord]] = {}
     for record in records:
         by_module.setdefault(record.module, []).append(record)
@@ -393,32 +1036,29 @@ def write_cards(records: list[SymbolRecord], cards_dir: Path) -> dict[str, str]:
         card_path = cards_dir / card_name
         module_to_card[module] = card_name
 
-        lines: list[str] = []
-        lines.append(f"# Module Card: `{module}`")
-        lines.append("")
-        lines.append(
+        buf = io.StringIO()
+        w = buf.write
+        w(f"# Module Card: `{module}`\n\n")
+        w(
             "> Generated by opensci-skill/scripts/build-symbol-index.py. "
-            "Use as dictionary-style lookup before opening source files."
+            "Use as dictionary-style lookup before opening source files.\n"
         )
-        lines.append("")
 
-        for rec in sorted(by_module[module], key=lambda r: r.symbol):
-            lines.append(f"## `{rec.symbol}`")
-            lines.append("")
-            lines.append(f"- kind: `{rec.kind}`")
-            lines.append(f"- signature: `{rec.signature}`")
+        for rec in by_module[module]:
+            w(f"\n## `{rec.symbol}`\n\n")
+            w(f"- kind: `{rec.kind}`\n")
+            w(f"- signature: `{rec.signature}`\n")
             if rec.summary:
-                lines.append(f"- summary: {rec.summary}")
+                w(f"- summary: {rec.summary}\n")
             else:
-                lines.append("- summary: [UNVERIFIED: no docstring summary available]")
+                w("- summary: [UNVERIFIED: no docstring summary available]\n")
             if rec.source_line is None:
-                lines.append(f"- source: `{rec.source_file}`")
+                w(f"- source: `{rec.source_file}`\n")
             else:
-                lines.append(f"- source: `{rec.source_file}:L{rec.source_line}`")
-            lines.append(f"- verification: `{rec.verification}`")
-            lines.append("")
+                w(f"- source: `{rec.source_file}:L{rec.source_line}`\n")
+            w(f"- verification: `{rec.verification}`\n")
 
-        card_path.write_text("\n".join(lines), encoding="utf-8")
+        card_path.write_text(buf.getvalue(), encoding="utf-8")
 
     return module_to_card
 
@@ -434,13 +1074,14 @@ def write_markdown_index(
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
     total = len(records)
-    functions = sum(1 for r in records if r.kind == "function")
-    classes = sum(1 for r in records if r.kind == "class")
-    methods = sum(1 for r in records if r.kind == "method")
-
+    kind_counts = {"function": 0, "class": 0, "method": 0}
     module_counts: dict[str, int] = {}
     for record in records:
+        kind_counts[record.kind] += 1
         module_counts[record.module] = module_counts.get(record.module, 0) + 1
+    functions = kind_counts["function"]
+    classes = kind_counts["class"]
+    methods = kind_counts["method"]
 
     lines: list[str] = []
     lines.append(f"# Symbol Index: `{package_name}`")
@@ -510,6 +1151,28 @@ def main() -> None:
         default=2,
         help="Runtime mode: max submodule depth (default: 2)",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Source mode: parallel parser processes (default: CPU count, 1 = serial)",
+    )
+    parser.add_argument(
+        "--parser",
+        choices=("auto", "ast", "tree-sitter"),
+        default="auto",
+        help="Source mode: parser backend (default: auto = tree-sitter if installed)",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=".cache/symbol-index",
+        help="Source mode: per-file parse cache (default: .cache/symbol-index)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Source mode: re-parse every file and do not touch the cache",
+    )
     parser.add_argument(
         "--no-methods",
         action="store_true",
@@ -534,6 +1197,16 @@ def main() -> None:
 
     include_methods = not args.no_methods
 
+    if args.parser == "tree-sitter" and not HAS_TREE_SITTER:
+        print(
+            "ERROR: --parser tree-sitter was set but tree_sitter/tree_sitter_python "
+            "are not installed. "
+            "Install with: pip install tree_sitter tree_sitter_python",
+            file=sys.stderr,
+        )
+        sys.exit(1)
+    use_tree_sitter = HAS_TREE_SITTER and args.parser != "ast"
+
     output_index = Path(args.output_index)
     output_jsonl = Path(args.output_jsonl)
     cards_dir = Path(args.cards_dir)
@@ -555,19 +1228,26 @@ def main() -> None:
         records, failures = collect_ast_records(
             pkg_root=pkg_root,
             include_methods=include_methods,
+            jobs=args.jobs,
+            use_tree_sitter=use_tree_sitter,
+            cache_dir=None if args.no_cache else Path(args.cache_dir),
         )
         mode = "ast"
 
-    write_jsonl(records, output_jsonl)
-    module_to_card = write_cards(records, cards_dir)
-    write_markdown_index(
-        package_name=package_name,
-        mode=mode,
-        records=records,
-        failures=failures,
-        output_path=output_index,
-        module_to_card=module_to_card,
-    )
+    # The JSONL must be sorted by symbol, so it can only start once parsing is
+    # done; stream it from a thread while the cards and index are rendered.
+    with ThreadPoolExecutor(max_workers=1) as writer:
+        jsonl_done = writer.submit(write_jsonl, records, output_jsonl)
+        module_to_card = write_cards(records, cards_dir)
+        write_markdown_index(
+            package_name=package_name,
+            mode=mode,
+            records=records,
+            failures=failures,
+            output_path=output_index,
+            module_to_card=module_to_card,
+        )
+        jsonl_done.result()
 
     print(f"Package     : {package_name}")
     print(f"Mode        : {mode}")
@@ -46,6 +46,7 @@ import inspect
 import pkgutil
 import re
 import sys
+import types
 from pathlib import Path
 from typing import Any
 
@@ -82,31 +83,79 @@ def is_public(name: str) -> bool:
 # ---------------------------------------------------------------------------
 
 
+def public_members(mod: Any) -> list[tuple[str, Any]]:
+    """Return public (name, value) pairs of a module without inspect.getmembers.
+
+    Reads the module namespace directly instead of resolving and sorting every
+    attribute. A module-level __dir__ (lazy loaders, or one that hides names)
+    decides which names are listed, as with inspect.getmembers; values not in
+    the namespace are resolved with getattr.
+    """
+    namespace = getattr(mod, "__dict__", None)
+    if namespace is not None and "__dir__" not in namespace:
+        return [
+            (name, obj) for name, obj in list(namespace.items()) if is_public(name)
+        ]
+
+    namespace = namespace or {}
+    members = []
+    for name in dir(mod):
+        if not is_public(name):
+            continue
+        if name in namespace:
+            members.append((name, namespace[name]))
+            continue
+        try:
+            members.append((name, getattr(mod, name)))
+        except AttributeError:
+            continue
+    return members
+
+
+def public_methods(cls: type) -> list[tuple[str, types.FunctionType]]:
+    """Return public plain functions of a class (inherited included), by name."""
+    seen: set[str] = set()
+    methods: list[tuple[str, types.FunctionType]] = []
+    for klass in cls.__mro__:
+        for name, value in vars(klass).items():
+            if name in seen:
+                continue
+            seen.add(name)
+            if not is_public(name):
+                continue
+            if isinstance(value, staticmethod):
+                value = value.__func__
+            if isinstance(value, types.FunctionType):
+                methods.append((name, value))
+    return sorted(methods, key=lambda m: m[0])
+
+
 def extract_module(mod: Any, module_name: str) -> list[str]:
     """Extract public classes and functions from a module. Returns markdown lines."""
     lines: list[str] = []
     entries: list[tuple[str, Any]] = []
+    top_level = module_name.split(".")[0]
 
-    for name, obj in inspect.getmembers(mod):
-        if not is_public(name):
+    for name, obj in public_members(mod):
+        if not (isinstance(obj, type) or type(obj) is types.FunctionType):
             continue
         # Only include things defined in (or re-exported from) this module
         obj_module = getattr(obj, "__module__", None) or ""
         if not (
             obj_module == module_name
-            or obj_module.startswith(module_name.split(".")[0])
+            or obj_module.startswith(top_level)
         ):
             continue
-        if inspect.isclass(obj) or inspect.isfunction(obj):
-            entries.append((name, obj))
+        entries.append((name, obj))
 
     if not entries:
         return []
 
     lines.append(f"\n## {module_name}\n")
 
-    for name, obj in sorted(entries, key=lambda x: x[0].lower()):
-        kind = "class" if inspect.isclass(obj) else "function"
+    for name, obj in sorted(entries, key=lambda x: (x[0].lower(), x[0])):
+        is_class = isinstance(obj, type)
+        kind = "class" if is_class else "function"
         sig = get_signature(obj)
         doc = first_lines(inspect.getdoc(obj), 3)
 
@@ -121,12 +170,8 @@ def extract_module(mod: Any, module_name: str) -> list[str]:
             lines.append("")
 
         # For classes: list public methods briefly
-        if inspect.isclass(obj):
-            methods = [
-                (mname, mobj)
-                for mname, mobj in inspect.getmembers(obj, predicate=inspect.isfunction)
-                if is_public(mname)
-            ]
+        if is_class:
+            methods = public_methods(obj)
             if methods:
                 method_names = ", ".join(f"`{m[0]}`" for m in methods[:15])
                 if len(methods) > 15:
@@ -144,7 +189,6 @@ def extract_module(mod: Any, module_name: str) -> list[str]:
 def walk_package(package_name: str, max_depth: int) -> list[tuple[int, str]]:
     """Return (depth, module_name) pairs for all submodules up to max_depth."""
     results: list[tuple[int, str]] = []
-    base_depth = package_name.count(".") + 1
 
     try:
         pkg = importlib.import_module(package_name)
@@ -159,16 +203,28 @@ def walk_package(package_name: str, max_depth: int) -> list[tuple[int, str]]:
         # Single module, not a package
         return results
 
-    for finder, modname, is_pkg in pkgutil.walk_packages(
-        path=pkg_path,
-        prefix=package_name + ".",
-        onerror=lambda name: None,
-    ):
-        depth = modname.count(".") - base_depth + 1
+    # Depth-first like pkgutil.walk_packages, but subpackages are only
+    # imported when their children are still within max_depth.
+    seen_paths: set[str] = set()
+
+    def walk(path: list[str], prefix: str, depth: int) -> None:
         if depth > max_depth:
-            continue
-        results.append((depth, modname))
+            return
+        for _, modname, is_pkg in pkgutil.iter_modules(path, prefix):
+            results.append((depth, modname))
+            if not is_pkg or depth == max_depth:
+                continue
+            try:
+                sub = importlib.import_module(modname)
+            except Exception:
+                continue
+            sub_path = [
+                p for p in getattr(sub, "__path__", None) or [] if p not in seen_paths
+            ]
+            seen_paths.update(sub_path)
+            walk(sub_path, modname + ".", depth + 1)
 
+    walk(list(pkg_path), package_name + ".", 1)
     return results
 
 
@@ -196,11 +252,14 @@ def extract(package_name: str, output_path: Path, max_depth: int) -> None:
 
     for i, (depth, modname) in enumerate(modules, 1):
         print(f"  [{i:>3}/{total}]  {modname}")
-        try:
-            mod = importlib.import_module(modname)
-        except Exception as exc:
-            all_lines.append(f"\n## {modname}\n\n*Import failed: {exc}*\n")
-            continue
+        # Packages were already imported by walk_package.
+        mod = sys.modules.get(modname)
+        if mod is None:
+            try:
+                mod = importlib.import_module(modname)
+            except Exception as exc:
+                all_lines.append(f"\n## {modname}\n\n*Import failed: {exc}*\n")
+                continue
 
         mod_lines = extract_module(mod, modname)
         if mod_lines:
@@ -15,26 +15,45 @@ Output:
         tutorials--preprocessing.md
         ...
     assets/docs-cache/<lib>/_manifest.txt   (list of all crawled URLs)
+    assets/docs-cache/<lib>/_cache.json     (ETag/Last-Modified per URL; re-runs
+                                             send conditional requests and keep
+                                             unchanged pages; --no-cache skips it)
+    assets/docs-cache/<lib>/_state.jsonl    (journal of an unfinished crawl; a
+                                             re-run after an interruption resumes
+                                             it, retrying failed URLs; deleted
+                                             when a crawl ends normally, so the
+                                             next run starts over and revalidates
+                                             via _cache.json; --fresh ignores it)
 
 Dependencies:
     requests (required)
     html2text (optional but recommended — falls back to basic tag stripping)
+    selectolax (optional — faster main-content extraction; regex fallback)
 
 Install:
     pip install requests html2text
 """
 
 import argparse
+import functools
+import hashlib
+import json
 import os
 import re
 import sys
+import threading
 import time
 import urllib.parse
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
 except ImportError:
     print(
         "ERROR: requests is required. Install with: pip install requests",
@@ -54,6 +73,113 @@ except ImportError:
     print("WARNING: html2text not installed. Falling back to basic tag stripping.")
     print("         Install for better output: pip install html2text")
 
+LexborHTMLParser: Any = None
+
+try:
+    from selectolax.lexbor import LexborHTMLParser as _LexborHTMLParser
+
+    LexborHTMLParser = _LexborHTMLParser
+    HAS_SELECTOLAX = True
+except ImportError:
+    # The regex-based region finder below is used instead.
+    HAS_SELECTOLAX = False
+
+
+# ---------------------------------------------------------------------------
+# Precompiled patterns
+# ---------------------------------------------------------------------------
+
+_SCRIPT_RE = re.compile(r"<script[^>]*>.*?</script>", re.DOTALL | re.IGNORECASE)
+_STYLE_RE = re.compile(r"<style[^>]*>.*?</style>", re.DOTALL | re.IGNORECASE)
+_TAG_RE = re.compile(r"<[^>]+>")
+_MULTISPACE_RE = re.compile(r" {2,}")
+_MULTINL_RE = re.compile(r"\n{3,}")
+_ENTITIES = (
+    ("&nbsp;", " "),
+    ("&lt;", "<"),
+    ("&gt;", ">"),
+    ("&amp;", "&"),
+    ("&quot;", '"'),
+)
+
+_HREF_RE = re.compile(r'href=["\']([^"\'#?][^"\']*)["\']')
+# Links to these are never fetched (compare against url.lower()).
+_SKIP_EXTS = (
+    ".pdf",
+    ".zip",
+    ".tar",
+    ".gz",
+    ".png",
+    ".jpg",
+    ".jpeg",
+    ".gif",
+    ".webp",
+    ".svg",
+    ".css",
+    ".js",
+    ".woff",
+    ".woff2",
+    ".ico",
+)
+
+# URLs containing these take the urlparse path in normalize_url (path params,
+# characters urlsplit strips or rejects).
+_URL_SLOW_CHARS = frozenset(";\t\r\n []\\")
+
+_FNAME_SEP_RE = re.compile(r"[/\\]")
+_FNAME_SAFE_RE = re.compile(r"[^a-zA-Z0-9_\-.]")
+_FNAME_COLLAPSE_RE = re.compile(r"_+")
+
+
+# ---------------------------------------------------------------------------
+# Content region extraction
+# ---------------------------------------------------------------------------
+
+# Tried in order; the first match is converted instead of the whole page.
+_CONTENT_SELECTORS = ("article", "main", "div.document", "div.body")
+
+_CONTENT_START_RES = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"<article\b[^>]*>",
+        r"<main\b[^>]*>",
+        r"<div\b[^>]*\bclass\s*=\s*[\"'][^\"']*(?<![\w-])document(?![\w-])[^>]*>",
+        r"<div\b[^>]*\bclass\s*=\s*[\"'][^\"']*(?<![\w-])body(?![\w-])[^>]*>",
+    )
+)
+
+
+def _balanced_element(html: str, start: re.Match) -> str:
+    """Return the element opened by the tag at start, through its matching close."""
+    tag = re.match(r"<(\w+)", start.group(0)).group(1)
+    tag_re = re.compile(rf"<(/?){tag}\b[^>]*>", re.IGNORECASE)
+    depth = 0
+    for m in tag_re.finditer(html, start.start()):
+        depth += -1 if m.group(1) else 1
+        if depth == 0:
+            return html[start.start() : m.end()]
+    return html[start.start() :]  # unclosed: keep the rest of the document
+
+
+def extract_main_content(html: str) -> str:
+    """Return the page's main content region, dropping sidebars and footers.
+
+    Uses selectolax when installed, else a tag-balancing regex scan. Falls
+    back to the full HTML when no known region is present.
+    """
+    if HAS_SELECTOLAX:
+        tree = LexborHTMLParser(html)
+        for selector in _CONTENT_SELECTORS:
+            node = tree.css_first(selector)
+            if node is not None:
+                return node.html or html
+        return html
+    for start_re in _CONTENT_START_RES:
+        start = start_re.search(html)
+        if start is not None:
+            return _balanced_element(html, start)
+    return html
+
 
 # ---------------------------------------------------------------------------
 # HTML → Markdown conversion
@@ -63,6 +189,10 @@ except ImportError:
 def html_to_markdown(html: str, base_url: str) -> str:
     """Convert HTML string to markdown. Uses html2text if available."""
     if HAS_HTML2TEXT:
+        # A fresh converter per page is deliberate: construction costs a few
+        # microseconds, but HTML2Text keeps parser state (pending whitespace,
+        # list/blockquote depth) between handle() calls, so a shared instance
+        # changes the markdown of later pages.
         h = html2text.HTML2Text()
         h.ignore_links = False
         h.ignore_images = True
@@ -73,20 +203,13 @@ def html_to_markdown(html: str, base_url: str) -> str:
         return h.handle(html)
     else:
         # Basic fallback: strip tags
-        text = re.sub(
-            r"<script[^>]*>.*?</script>", "", html, flags=re.DOTALL | re.IGNORECASE
-        )
-        text = re.sub(
-            r"<style[^>]*>.*?</style>", "", text, flags=re.DOTALL | re.IGNORECASE
-        )
-        text = re.sub(r"<[^>]+>", " ", text)
-        text = re.sub(r"&nbsp;", " ", text)
-        text = re.sub(r"&lt;", "<", text)
-        text = re.sub(r"&gt;", ">", text)
-        text = re.sub(r"&amp;", "&", text)
-        text = re.sub(r"&quot;", '"', text)
-        text = re.sub(r" {2,}", " ", text)
-        text = re.sub(r"\n{3,}", "\n\n", text)
+        text = _SCRIPT_RE.sub("", html)
+        text = _STYLE_RE.sub("", text)
+        text = _TAG_RE.sub(" ", text)
+        for entity, char in _ENTITIES:
+            text = text.replace(entity, char)
+        text = _MULTISPACE_RE.sub(" ", text)
+        text = _MULTINL_RE.sub("\n\n", text)
         return text.strip()
 
 
@@ -95,8 +218,16 @@ def html_to_markdown(html: str, base_url: str) -> str:
 # ---------------------------------------------------------------------------
 
 
+@functools.lru_cache(maxsize=4096)
 def normalize_url(url: str) -> str:
-    """Strip fragment and trailing slash for deduplication."""
+    """Strip query, fragment and trailing slash for deduplication."""
+    # Fast path for the plain http(s) URLs urljoin hands us: slicing gives the
+    # same result as the urlparse/urlunparse round-trip below.
+    if url.startswith(("http://", "https://")) and not _URL_SLOW_CHARS & set(url):
+        head = url.partition("#")[0].partition("?")[0]
+        netloc_start = head.find("://") + 3
+        if head[netloc_start : netloc_start + 1] not in ("", "/"):  # has netloc
+            return head.rstrip("/")
     parsed = urllib.parse.urlparse(url)
     path = parsed.path.rstrip("/")
     return urllib.parse.urlunparse((parsed.scheme, parsed.netloc, path, "", "", ""))
@@ -115,22 +246,30 @@ def url_to_filename(url: str, base_url: str) -> str:
     if not path:
         return "index"
     # Replace path separators and special chars with --
-    name = re.sub(r"[/\\]", "--", path)
-    name = re.sub(r"[^a-zA-Z0-9_\-.]", "_", name)
-    name = re.sub(r"_+", "_", name).strip("_")
+    name = _FNAME_SEP_RE.sub("--", path)
+    name = _FNAME_SAFE_RE.sub("_", name)
+    name = _FNAME_COLLAPSE_RE.sub("_", name).strip("_")
     return name or "index"
 
 
 def extract_links(html: str, base_url: str, allowed_prefix: str) -> list[str]:
-    """Extract absolute links from HTML that start with allowed_prefix."""
-    hrefs = re.findall(r'href=["\']([^"\'#?][^"\']*)["\']', html)
-    links = []
-    for href in hrefs:
+    """Extract absolute page links from HTML that start with allowed_prefix.
+
+    Links to static assets (_SKIP_EXTS) are dropped here, before they reach
+    the crawl queue.
+    """
+    # One C-level scan of the body; navigation bars repeat the same hrefs on
+    # every page, so join and normalize each distinct one only once.
+    links: dict[str, None] = {}
+    for href in dict.fromkeys(_HREF_RE.findall(html)):
         abs_url = urllib.parse.urljoin(base_url, href)
         abs_url = normalize_url(abs_url)
-        if abs_url.startswith(allowed_prefix):
-            links.append(abs_url)
-    return links
+        if not abs_url.startswith(allowed_prefix):
+            continue
+        if abs_url.lower().endswith(_SKIP_EXTS):
+            continue
+        links[abs_url] = None
+    return list(links)
 
 
 # ---------------------------------------------------------------------------
@@ -138,13 +277,240 @@ def extract_links(html: str, base_url: str, allowed_prefix: str) -> list[str]:
 # ---------------------------------------------------------------------------
 
 
+def write_utf8(path: Path, text: str) -> None:
+    """Write text as UTF-8 with raw os calls (no TextIOWrapper per page)."""
+    data = memoryview(text.encode("utf-8"))
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        while data:
+            data = data[os.write(fd, data) :]
+    finally:
+        os.close(fd)
+
+
+def make_session(concurrency: int = 1) -> requests.Session:
+    """Return a keep-alive session that retries transient server errors.
+
+    The per-host pool holds a connection for each of the concurrency
+    prefetch workers plus the crawl loop's own fetch, so none is discarded.
+    """
+    session = requests.Session()
+    retry = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=("GET", "HEAD"),
+    )
+    adapter = HTTPAdapter(
+        pool_connections=4, pool_maxsize=max(1, concurrency) + 1, max_retries=retry
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers["User-Agent"] = "opensci-skill-fetch-docs/1.0 (educational crawler)"
+    session.headers["Accept-Encoding"] = "gzip, deflate"
+    session.headers["Connection"] = "keep-alive"
+    return session
+
+
+# Upper bound on the decoded body read for a single page.
+MAX_PAGE_BYTES = 16 * 1024 * 1024
+
+
+def _decode_body(body: bytes, encoding: str | None) -> str:
+    # Same fallbacks as requests.Response.text.
+    if encoding is None:
+        chardet = getattr(requests.compat, "chardet", None)
+        encoding = chardet.detect(body)["encoding"] if chardet else "utf-8"
+    try:
+        return str(body, encoding or "utf-8", errors="replace")
+    except (LookupError, TypeError):
+        return str(body, errors="replace")
+
+
+class RequestPacer:
+    """Space request starts at least interval seconds apart, across threads."""
+
+    def __init__(self, interval: float) -> None:
+        self._interval = max(0.0, interval)
+        self._lock = threading.Lock()
+        self._next_start = 0.0
+
+    def wait(self) -> None:
+        if self._interval <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_start)
+            self._next_start = start + self._interval
+        if start > now:
+            time.sleep(start - now)
+
+
+@dataclass
+class FetchResult:
+    content_type: str = ""
+    text: str = ""
+    not_modified: bool = False
+    etag: str = ""
+    last_modified: str = ""
+    digest: str = ""  # blake2b of the raw HTML body
+
+
+def fetch_page(
+    session: requests.Session,
+    url: str,
+    pacer: RequestPacer,
+    headers: dict[str, str] | None = None,
+) -> FetchResult | Exception:
+    """GET url and return its FetchResult, or the exception raised.
+
+    The request waits for its slot from pacer first. The body is streamed
+    and only read for HTML responses, up to MAX_PAGE_BYTES. headers carries
+    conditional-request validators.
+    """
+    pacer.wait()
+    try:
+        with session.get(url, timeout=15, stream=True, headers=headers) as resp:
+            resp.raise_for_status()
+            if resp.status_code == 304:
+                return FetchResult(not_modified=True)
+            result = FetchResult(
+                content_type=resp.headers.get("Content-Type", ""),
+                etag=resp.headers.get("ETag", ""),
+                last_modified=resp.headers.get("Last-Modified", ""),
+            )
+            if "html" not in result.content_type:
+                return result
+            chunks: list[bytes] = []
+            size = 0
+            for chunk in resp.iter_content(chunk_size=1 << 16):
+                chunks.append(chunk)
+                size += len(chunk)
+                if size >= MAX_PAGE_BYTES:
+                    break
+            body = b"".join(chunks)[:MAX_PAGE_BYTES]
+            result.digest = hashlib.blake2b(body, digest_size=16).hexdigest()
+            # Decoding can need charset detection; do it on the worker thread.
+            result.text = _decode_body(body, resp.encoding)
+    except Exception as exc:
+        return exc
+    return result
+
+
+# ---------------------------------------------------------------------------
+# Re-crawl cache
+# ---------------------------------------------------------------------------
+
+CACHE_FILENAME = "_cache.json"
+
+
+def load_page_cache(
+    output_dir: Path, base_url: str, full_page: bool
+) -> dict[str, dict[str, Any]]:
+    """Load per-URL validators saved by a previous crawl with the same settings."""
+    try:
+        data = json.loads((output_dir / CACHE_FILENAME).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("base_url") != base_url:
+        return {}
+    if data.get("full_page", False) != full_page:
+        return {}  # the saved markdown was converted from a different region
+    pages = data.get("pages")
+    return pages if isinstance(pages, dict) else {}
+
+
+def save_page_cache(
+    output_dir: Path,
+    base_url: str,
+    full_page: bool,
+    pages: dict[str, dict[str, Any]],
+) -> None:
+    payload = {"base_url": base_url, "full_page": full_page, "pages": pages}
+    write_utf8(output_dir / CACHE_FILENAME, json.dumps(payload, indent=1))
+
+
+def conditional_headers(entry: dict[str, Any] | None) -> dict[str, str] | None:
+    if not entry:
+        return None
+    headers = {}
+    if entry.get("etag"):
+        headers["If-None-Match"] = entry["etag"]
+    if entry.get("last_modified"):
+        headers["If-Modified-Since"] = entry["last_modified"]
+    return headers or None
+
+
+# ---------------------------------------------------------------------------
+# Resumable crawl state
+# ---------------------------------------------------------------------------
+
+STATE_FILENAME = "_state.jsonl"
+
+
+def load_crawl_state(
+    output_dir: Path, base_url: str, full_page: bool
+) -> dict[str, list[str]] | None:
+    """Replay the journal of an unfinished crawl with the same settings.
+
+    The first line holds the settings and start URL; every later line is one
+    handled URL and the links it queued. The queue is every URL ever queued,
+    in order, minus the handled ones, so URLs whose fetch failed are retried.
+    """
+    try:
+        lines = (output_dir / STATE_FILENAME).read_text(encoding="utf-8").splitlines()
+    except OSError:
+        return None
+    try:
+        header = json.loads(lines[0]) if lines else None
+    except ValueError:
+        return None
+    if not isinstance(header, dict) or header.get("base_url") != base_url:
+        return None
+    if header.get("full_page", False) != full_page:
+        return None
+    if not isinstance(header.get("start"), str):
+        return None
+
+    order = [header["start"]]
+    handled: set[str] = set()
+    manifest: list[str] = []
+    for line in lines[1:]:
+        try:
+            record = json.loads(line)
+        except ValueError:
+            break  # torn last line of an interrupted write
+        url = record.get("url") if isinstance(record, dict) else None
+        if not isinstance(url, str):
+            break
+        handled.add(url)
+        if record.get("saved"):
+            manifest.append(url)
+        order.extend(link for link in record.get("queued", ()) if isinstance(link, str))
+    return {
+        "visited": sorted(handled),
+        "queue": [url for url in order if url not in handled],
+        "manifest": manifest,
+    }
+
+
 def crawl(
-    base_url: str, lib: str, max_pages: int, delay: float, output_dir: Path
+    base_url: str,
+    lib: str,
+    max_pages: int,
+    delay: float,
+    output_dir: Path,
+    concurrency: int = 1,
+    use_cache: bool = True,
+    full_page: bool = False,
+    resume: bool = True,
 ) -> None:
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    session = requests.Session()
-    session.headers["User-Agent"] = "opensci-skill-fetch-docs/1.0 (educational crawler)"
+    session = make_session(concurrency)
+    # One pacer for all workers: concurrency overlaps slow responses but
+    # never raises the request rate above one per delay seconds.
+    pacer = RequestPacer(delay)
 
     # Normalize base URL for prefix matching
     base_norm = normalize_url(base_url)
@@ -154,65 +520,157 @@ def crawl(
         allowed_prefix = base_norm
 
     visited: set[str] = set()
-    queue: list[str] = [base_norm]
+    queue: deque[str] = deque([base_norm])
     manifest: list[str] = []
     skipped = 0
 
+    # Pick up where an interrupted run stopped: its pages are neither
+    # refetched nor re-listed, only URLs still in its queue (and links they
+    # reveal) are.
+    state = load_crawl_state(output_dir, base_url, full_page) if resume else None
+    if state is not None:
+        visited.update(state["visited"])
+        queue = deque(state["queue"])
+        manifest = state["manifest"]
+    queued: set[str] = visited | set(queue) | {base_norm}  # everything ever enqueued
+
+    # url -> validators, body digest and in-scope links from the last crawl.
+    # A page is only revalidated when its markdown file is still on disk.
+    page_cache = load_page_cache(output_dir, base_url, full_page) if use_cache else {}
+    unchanged = 0
+
+    def out_path_for(url: str) -> Path:
+        return output_dir / (url_to_filename(url, base_url) + ".md")
+
+    def cached_entry(url: str) -> dict[str, Any] | None:
+        entry = page_cache.get(url)
+        if entry and out_path_for(url).exists():
+            return entry
+        return None
+
     print(f"Crawling: {base_url}")
     print(f"Output:   {output_dir}")
     print(f"Max pages: {max_pages}")
+    if state is not None:
+        print(f"Resuming: {len(visited)} visited, {len(queue)} queued (see --fresh)")
     print()
 
-    while queue and len(visited) < max_pages:
-        url = queue.pop(0)
-        if url in visited:
-            continue
-
-        # Skip non-HTML resources
-        if re.search(r"\.(pdf|zip|tar|gz|png|jpg|svg|css|js|woff|ico)$", url, re.I):
-            skipped += 1
-            continue
-
-        visited.add(url)
-
-        try:
-            resp = session.get(url, timeout=15)
-            resp.raise_for_status()
-        except Exception as exc:
-            print(f"  SKIP  {url}  ({exc})")
-            continue
-
-        content_type = resp.headers.get("Content-Type", "")
-        if "html" not in content_type:
-            skipped += 1
-            continue
-
-        html = resp.text
-        markdown = html_to_markdown(html, url)
-
-        # Save file
-        filename = url_to_filename(url, base_url) + ".md"
-        out_path = output_dir / filename
-        out_path.write_text(markdown, encoding="utf-8")
-
-        manifest.append(url)
-        print(f"  [{len(visited):>3}/{max_pages}]  {url}")
-
-        # Enqueue new links
-        new_links = extract_links(html, url, allowed_prefix)
-        for link in new_links:
-            if link not in visited and link not in queue:
-                queue.append(link)
-
-        if delay > 0:
-            time.sleep(delay)
-
-    # Write manifest
+    # Pages are fetched ahead of the BFS cursor by a thread pool, but handled
+    # strictly in queue order, so the output matches a serial crawl.
+    pool = ThreadPoolExecutor(max_workers=max(1, concurrency))
+    in_flight: dict[str, Future] = {}
+
+    def prefetch() -> None:
+        budget = min(concurrency, max_pages - len(visited)) - len(in_flight)
+        for pending in queue:
+            if budget <= 0:
+                break
+            if pending in in_flight or pending.lower().endswith(_SKIP_EXTS):
+                continue
+            headers = conditional_headers(cached_entry(pending))
+            in_flight[pending] = pool.submit(
+                fetch_page, session, pending, pacer, headers
+            )
+            budget -= 1
+
+    # The manifest is line-buffered, so an interrupted crawl keeps its record.
     manifest_path = output_dir / "_manifest.txt"
-    manifest_path.write_text("\n".join(manifest), encoding="utf-8")
+    manifest_f = manifest_path.open("w", encoding="utf-8", buffering=1)
+    manifest_f.writelines(url + "\n" for url in manifest)
+    # One line per handled URL; the state is never rewritten as a whole.
+    state_path = output_dir / STATE_FILENAME
+    state_f = state_path.open(
+        "a" if state is not None else "w", encoding="utf-8", buffering=1
+    )
+    if state is None:
+        header = {"base_url": base_url, "full_page": full_page, "start": base_norm}
+        state_f.write(json.dumps(header) + "\n")
+    finished = False
+    try:
+        while queue and len(visited) < max_pages:
+            prefetch()
+            url = queue.popleft()
+            if url in visited:
+                continue
+
+            # Skip non-HTML resources
+            if url.lower().endswith(_SKIP_EXTS):
+                skipped += 1
+                continue
+
+            visited.add(url)
+
+            entry = cached_entry(url)
+            future = in_flight.pop(url, None)
+            if future is not None:
+                result = future.result()
+            else:
+                headers = conditional_headers(entry)
+                result = fetch_page(session, url, pacer, headers)
+            if isinstance(result, Exception):
+                print(f"  SKIP  {url}  ({result})")
+                continue
+
+            if result.not_modified and entry is not None:
+                # 304: keep the existing markdown and follow the saved links.
+                new_links = list(entry.get("links", []))
+                unchanged += 1
+                status = "  (not modified)"
+            elif result.not_modified:
+                print(f"  SKIP  {url}  (304 without a cached copy)")
+                continue
+            else:
+                if "html" not in result.content_type:
+                    skipped += 1
+                    state_f.write(json.dumps({"url": url}) + "\n")
+                    continue
+
+                html = result.text
+                new_links = extract_links(html, url, allowed_prefix)
+                if entry is not None and entry.get("digest") == result.digest:
+                    unchanged += 1
+                    status = "  (unchanged)"
+                else:
+                    # Links come from the full page; only the markdown is trimmed.
+                    content = html if full_page else extract_main_content(html)
+                    write_utf8(out_path_for(url), html_to_markdown(content, url))
+                    status = ""
+                page_cache[url] = {
+                    "etag": result.etag,
+                    "last_modified": result.last_modified,
+                    "digest": result.digest,
+                    "links": new_links,
+                }
+
+            manifest_f.write(url + "\n")
+            manifest.append(url)
+            print(f"  [{len(visited):>3}/{max_pages}]  {url}{status}")
+
+            # Enqueue new links
+            fresh = [link for link in dict.fromkeys(new_links) if link not in queued]
+            queued.update(fresh)
+            queue.extend(fresh)
+
+            record = {"url": url, "saved": True, "queued": fresh}
+            state_f.write(json.dumps(record) + "\n")
+        finished = True
+    finally:
+        manifest_f.close()
+        state_f.close()
+        for future in in_flight.values():
+            future.cancel()
+        pool.shutdown(wait=True)
+    if finished:
+        # Nothing left to resume; the next run starts over from the cache.
+        state_path.unlink(missing_ok=True)
+
+    if use_cache:
+        save_page_cache(output_dir, base_url, full_page, page_cache)
 
     print()
     print(f"Done. {len(visited)} pages saved, {skipped} non-HTML skipped.")
+    if unchanged:
+        print(f"Reused {unchanged} unchanged page(s) from the previous crawl.")
     print(f"Manifest: {manifest_path}")
     print(f"Cache dir: {output_dir}")
 
@@ -239,13 +697,36 @@ def main() -> None:
         "--delay",
         type=float,
         default=0.3,
-        help="Seconds between requests (default: 0.3)",
+        help="Minimum seconds between the starts of any two requests, shared by "
+        "all --concurrency workers (default: 0.3)",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=8,
+        help="Pages fetched in parallel, still paced by --delay (default: 8)",
     )
     parser.add_argument(
         "--output",
         default=None,
         help="Output directory (default: assets/docs-cache/<lib>)",
     )
+    parser.add_argument(
+        "--full-page",
+        action="store_true",
+        help="Convert the whole page, not just its article/main/div.document region",
+    )
+    parser.add_argument(
+        "--fresh",
+        action="store_true",
+        help="Start over instead of resuming an interrupted crawl from "
+        f"<output>/{STATE_FILENAME}",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Re-download every page; do not read or write <output>/{CACHE_FILENAME}",
+    )
     parser.add_argument(
         "--require-html2text",
         action="store_true",
@@ -272,6 +753,10 @@ def main() -> None:
         max_pages=args.max_pages,
         delay=args.delay,
         output_dir=output_dir,
+        concurrency=args.concurrency,
+        use_cache=not args.no_cache,
+        full_page=args.full_page,
+        resume=not args.fresh,
     )
 
 
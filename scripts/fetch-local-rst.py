@@ -18,6 +18,7 @@ Arguments
     --source   Path to the Sphinx documentation root — the directory containing
                conf.py (e.g., doc/ or doc/source/) (required)
     --output   Output directory (default: assets/docs-cache/)
+    --jobs     Parallel conversion processes (default: CPU count, 1 = serial)
 
 Output
 ------
@@ -50,7 +51,9 @@ import argparse
 import os
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import TextIO
 
 
 # ---------------------------------------------------------------------------
@@ -58,11 +61,29 @@ from pathlib import Path
 # ---------------------------------------------------------------------------
 
 # Characters commonly used as RST heading adornments
-_ADORNMENT_CHARS = set('!"#$%&\'()*+,-./:;<=>?@[\\]^_`{|}~')
+_ADORNMENT_CHARS = frozenset('!"#$%&\'()*+,-./:;<=>?@[\\]^_`{|}~')
 
 def _is_adornment(line: str) -> bool:
+    # Cheap first-character test rejects prose before scanning the line.
+    if not line or line[0] not in _ADORNMENT_CHARS:
+        return False
     stripped = line.rstrip()
-    return len(stripped) >= 2 and all(c in _ADORNMENT_CHARS for c in stripped)
+    # RST adornments repeat a single character.
+    return len(stripped) >= 2 and stripped.count(stripped[0]) == len(stripped)
+
+
+def _consume_indented(lines: list[str], i: int, n: int) -> int:
+    """Return the index just past the indented block starting at lines[i].
+
+    The block continues through lines indented by three spaces and blank
+    (whitespace-only) lines.
+    """
+    while i < n:
+        line = lines[i]
+        if line and not line.startswith('   ') and not line.isspace():
+            break
+        i += 1
+    return i
 
 
 # ---------------------------------------------------------------------------
@@ -92,6 +113,15 @@ class RstConverter:
     # Substitution reference: |name|
     _SUBSTITUTION_REF = re.compile(r'\|([^|]+)\|')
 
+    # Directive start: .. name:: args
+    _DIRECTIVE_RE = re.compile(r'^(\s*)\.\.\s+(\w[\w-]*)::(.*)$')
+
+    # Directive option line: :linenos:, :caption: ...
+    _OPTION_LINE_RE = re.compile(r'^\s+:\w')
+
+    # Cross-ref with explicit target: Title <target>
+    _INNER_REF_RE = re.compile(r'^(.*?)\s*<[^>]+>$')
+
     # Directives we silently drop (body is also dropped via indented block skip)
     _DROP_DIRECTIVES = {
         'toctree', 'automodule', 'autoclass', 'autofunction', 'automethod',
@@ -111,11 +141,12 @@ class RstConverter:
 
     def convert(self, rst: str) -> str:
         lines = rst.splitlines()
+        n = len(lines)
         output: list[str] = []
         i = 0
         heading_stack: list[str] = []  # tracks adornment chars in encounter order
 
-        while i < len(lines):
+        while i < n:
             line = lines[i]
 
             # ----------------------------------------------------------------
@@ -123,9 +154,9 @@ class RstConverter:
             # ----------------------------------------------------------------
             # Pattern A: overline + title + underline
             if (
-                i + 2 < len(lines)
+                i + 2 < n
                 and _is_adornment(line)
-                and not lines[i + 1].strip() == ''
+                and lines[i + 1] and not lines[i + 1].isspace()
                 and _is_adornment(lines[i + 2])
                 and lines[i][0] == lines[i + 2][0]
             ):
@@ -139,9 +170,9 @@ class RstConverter:
 
             # Pattern B: title + underline
             if (
-                i + 1 < len(lines)
+                i + 1 < n
                 and _is_adornment(lines[i + 1])
-                and line.strip()
+                and line and not line.isspace()
                 and not _is_adornment(line)
             ):
                 underline = lines[i + 1]
@@ -158,7 +189,7 @@ class RstConverter:
             # ----------------------------------------------------------------
             # Directive detection
             # ----------------------------------------------------------------
-            dir_match = re.match(r'^(\s*)\.\.\s+(\w[\w-]*)::(.*)$', line)
+            dir_match = self._DIRECTIVE_RE.match(line)
             if dir_match:
                 indent_prefix = dir_match.group(1)
                 directive = dir_match.group(2).lower()
@@ -170,18 +201,17 @@ class RstConverter:
                     # collect option lines (:linenos:, etc.) then blank, then body
                     i += 1
                     # skip option lines
-                    while i < len(lines) and re.match(r'^\s+:\w', lines[i]):
+                    while i < n and self._OPTION_LINE_RE.match(lines[i]):
                         i += 1
                     # skip blank line(s)
-                    while i < len(lines) and lines[i].strip() == '':
+                    while i < n and (not lines[i] or lines[i].isspace()):
                         i += 1
                     # collect indented body
-                    body_lines = []
-                    while i < len(lines) and (lines[i].startswith('   ') or lines[i].strip() == ''):
-                        body_lines.append(lines[i])
-                        i += 1
+                    end = _consume_indented(lines, i, n)
+                    body_lines = lines[i:end]
+                    i = end
                     # strip trailing blank lines
-                    while body_lines and body_lines[-1].strip() == '':
+                    while body_lines and (not body_lines[-1] or body_lines[-1].isspace()):
                         body_lines.pop()
                     # dedent by 3 (or common indent)
                     body = '\n'.join(l[3:] if l.startswith('   ') else l for l in body_lines)
@@ -196,11 +226,10 @@ class RstConverter:
                     label = directive.upper()
                     i += 1
                     # collect indented body
-                    body_lines = []
-                    while i < len(lines) and (lines[i].startswith('   ') or lines[i].strip() == ''):
-                        body_lines.append(lines[i])
-                        i += 1
-                    body = ' '.join(l.strip() for l in body_lines if l.strip())
+                    end = _consume_indented(lines, i, n)
+                    body_lines = lines[i:end]
+                    i = end
+                    body = ' '.join(filter(None, map(str.strip, body_lines)))
                     if rest:
                         body = rest + (' ' + body if body else '')
                     output.append(f'> **{label}:** {body}')
@@ -209,9 +238,7 @@ class RstConverter:
 
                 # drop directives — consume their indented block
                 if directive in self._DROP_DIRECTIVES:
-                    i += 1
-                    while i < len(lines) and (lines[i].startswith('   ') or lines[i].strip() == ''):
-                        i += 1
+                    i = _consume_indented(lines, i + 1, n)
                     continue
 
                 # hyperlink target: .. _name: url
@@ -221,9 +248,7 @@ class RstConverter:
                     continue  # drop link targets (references are inlined)
 
                 # generic directive we don't recognise — drop it and its body
-                i += 1
-                while i < len(lines) and (lines[i].startswith('   ') or lines[i].strip() == ''):
-                    i += 1
+                i = _consume_indented(lines, i + 1, n)
                 continue
 
             # ----------------------------------------------------------------
@@ -246,24 +271,38 @@ class RstConverter:
     # ----------------------------------------------------------------
     # Inline transforms
     # ----------------------------------------------------------------
+    def _role_repl(self, m: re.Match) -> str:
+        text = m.group(1)
+        # :ref:`Title <target>` → `Title`
+        inner = self._INNER_REF_RE.match(text)
+        if inner:
+            text = inner.group(1).strip()
+        return f'`{text}`'
+
     def _transform_inline(self, line: str) -> str:
+        # Every pass needs a backtick except substitutions, which need '|'.
+        # Most prose lines have neither, so skip all five scans for them.
+        if '`' not in line:
+            if '|' in line:
+                line = self._SUBSTITUTION_REF.sub(r'(\1)', line)
+            return line
+        # Each pass is still applied in order to the previous pass's output;
+        # the substring guards only skip passes that cannot match.
         # Anonymous hyperlinks: `text <url>`_ → [text](url)
-        line = self._ANON_LINK.sub(r'[\1](\2)', line)
+        if '>`_' in line:
+            line = self._ANON_LINK.sub(r'[\1](\2)', line)
         # Named refs: `text`_ → **text** (we can't resolve without target map)
-        line = self._NAMED_REF.sub(r'**\1**', line)
+        if '`_' in line:
+            line = self._NAMED_REF.sub(r'**\1**', line)
         # Roles → backtick text (keep only the title part of cross-ref)
-        def role_repl(m):
-            text = m.group(1)
-            # :ref:`Title <target>` → `Title`
-            inner = re.match(r'^(.*?)\s*<[^>]+>$', text)
-            if inner:
-                text = inner.group(1).strip()
-            return f'`{text}`'
-        line = self._ROLE_PATTERN.sub(role_repl, line)
+        if ':`' in line:
+            line = self._ROLE_PATTERN.sub(self._role_repl, line)
         # ``code`` → `code`
-        line = self._INLINE_CODE.sub(r'`\1`', line)
+        if '``' in line:
+            line = self._INLINE_CODE.sub(r'`\1`', line)
         # Substitution refs: |name| → (name)
-        line = self._SUBSTITUTION_REF.sub(r'(\1)', line)
+        if '|' in line:
+            line = self._SUBSTITUTION_REF.sub(r'(\1)', line)
         return line
 
 
@@ -271,42 +310,90 @@ class RstConverter:
 # File walker
 # ---------------------------------------------------------------------------
 
-def process_rst_tree(source_dir: Path, output_dir: Path) -> list[str]:
+def _write_utf8(path: Path, text: str) -> None:
+    """Write text as UTF-8 with raw os calls (no TextIOWrapper per file)."""
+    data = memoryview(text.encode('utf-8'))
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
+
+
+# Directories never descended into when collecting sources
+_PRUNE_DIRS = frozenset({'.git', '__pycache__', '_build'})
+
+
+def _convert_one(rst_path: Path) -> tuple[str | None, str | None]:
+    """Read and convert one .rst file; returns (markdown, error)."""
+    try:
+        rst_text = rst_path.read_text(encoding='utf-8', errors='replace')
+    except OSError as e:
+        return None, str(e)
+    return RstConverter().convert(rst_text), None
+
+
+def process_rst_tree(
+    source_dir: Path, output_dir: Path, manifest: TextIO, jobs: int = 1
+) -> int:
     """Walk source_dir, convert every .rst → .md and copy every source .md in output_dir.
 
     .rst files are converted to Markdown via RstConverter.
     .md files found in the doc tree are copied as-is (myst-parser sources).
     Auto-generated directories (e.g., modules/generated/, api/generated/) that
     only exist after ``make html`` are silently skipped if absent — no error.
-    """
-    converter = RstConverter()
-    manifest: list[str] = []
+    ``_build/``, ``.git/`` and ``__pycache__/`` are never descended into.
 
-    rst_files = sorted(source_dir.rglob('*.rst'))
-    md_files = sorted(source_dir.rglob('*.md'))
+    Each processed file's relative path is written to manifest as it is done;
+    returns the number of files written.
+    """
+    count = 0
+
+    # One walk for both suffixes; build output and VCS/bytecode dirs are pruned.
+    rst_files: list[Path] = []
+    md_files: list[Path] = []
+    for dirpath, dirnames, filenames in os.walk(source_dir):
+        dirnames[:] = [d for d in dirnames if d not in _PRUNE_DIRS]
+        for name in filenames:
+            if name.endswith('.rst'):
+                rst_files.append(Path(dirpath, name))
+            elif name.endswith('.md'):
+                md_files.append(Path(dirpath, name))
+    rst_files.sort()
+    md_files.sort()
 
     if not rst_files and not md_files:
         print(f'[warn] No .rst or .md files found under {source_dir}', file=sys.stderr)
-        return manifest
+        return count
 
     # --- Process .rst files (convert to Markdown) ---
-    for rst_path in rst_files:
-        rel = rst_path.relative_to(source_dir)
-        out_path = output_dir / rel.with_suffix('.md')
-        out_path.parent.mkdir(parents=True, exist_ok=True)
-
-        try:
-            rst_text = rst_path.read_text(encoding='utf-8', errors='replace')
-        except OSError as e:
-            print(f'[error] Cannot read {rst_path}: {e}', file=sys.stderr)
-            continue
-
-        md_text = converter.convert(rst_text)
-        out_path.write_text(md_text, encoding='utf-8')
-
-        rel_str = str(rel)
-        manifest.append(rel_str)
-        print(f'  converted: {rel_str}')
+    # Conversion is CPU-bound, so fan it out to worker processes; results come
+    # back in file order and are written from this process only.
+    pool = None
+    if jobs > 1 and len(rst_files) > 1:
+        pool = ProcessPoolExecutor(max_workers=jobs)
+        converted = pool.map(_convert_one, rst_files, chunksize=16)
+    else:
+        converted = map(_convert_one, rst_files)
+
+    try:
+        for rst_path, (md_text, error) in zip(rst_files, converted):
+            rel = rst_path.relative_to(source_dir)
+            if md_text is None:
+                print(f'[error] Cannot read {rst_path}: {error}', file=sys.stderr)
+                continue
+            out_path = output_dir / rel.with_suffix('.md')
+            out_path.parent.mkdir(parents=True, exist_ok=True)
+            _write_utf8(out_path, md_text)
+
+            rel_str = str(rel)
+            manifest.write(rel_str + '\n')
+            count += 1
+            print(f'  converted: {rel_str}')
+    finally:
+        if pool is not None:
+            pool.shutdown()
 
     # --- Process source .md files (copy as-is; myst-parser sources) ---
     for md_path in md_files:
@@ -323,13 +410,14 @@ def process_rst_tree(source_dir: Path, output_dir: Path) -> list[str]:
             print(f'[error] Cannot read {md_path}: {e}', file=sys.stderr)
             continue
 
-        out_path.write_text(text, encoding='utf-8')
+        _write_utf8(out_path, text)
 
         rel_str = str(rel)
-        manifest.append(rel_str)
+        manifest.write(rel_str + '\n')
+        count += 1
         print(f'  copied (md): {rel_str}')
 
-    return manifest
+    return count
 
 
 # ---------------------------------------------------------------------------
@@ -348,6 +436,10 @@ def main():
         '--output', default='assets/docs-cache',
         help='Output directory (default: assets/docs-cache/)'
     )
+    parser.add_argument(
+        '--jobs', type=int, default=os.cpu_count() or 1,
+        help='Parallel conversion processes (default: CPU count, 1 = serial)'
+    )
     args = parser.parse_args()
 
     source_dir = Path(args.source).resolve()
@@ -362,13 +454,12 @@ def main():
     print(f'Output : {output_dir}')
     print()
 
-    manifest = process_rst_tree(source_dir, output_dir)
-
-    # Write manifest
+    # Manifest lines are streamed (line-buffered) as files are processed.
     manifest_path = output_dir / '_manifest.txt'
-    manifest_path.write_text('\n'.join(manifest) + '\n', encoding='utf-8')
+    with manifest_path.open('w', encoding='utf-8', buffering=1) as manifest:
+        count = process_rst_tree(source_dir, output_dir, manifest, jobs=args.jobs)
     print()
-    print(f'Processed {len(manifest)} file(s) (.rst converted, .md copied).')
+    print(f'Processed {count} file(s) (.rst converted, .md copied).')
     print(f'Manifest : {manifest_path}')
 
 
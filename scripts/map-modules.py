@@ -16,11 +16,17 @@ Usage
     # Local source tree (no install needed)
     python map-modules.py --source <path/to/pkg_root> [--output <path>]
 
+    # Many packages in one process: load this file with importlib and call
+    build_module_map(pkg_name=<name>, output=<path>)   # returns the markdown
+
 Arguments
 ---------
     --package   Importable package name  (mutually exclusive with --source)
     --source    Path to the package root directory containing __init__.py
     --output    Output markdown file  (default: assets/module-map.md)
+    --cache-dir Parsed __init__ AST cache, keyed by file content
+                (default: .cache/module-map)
+    --no-cache  Re-parse every run and do not touch the cache
 
 Output sections
 ---------------
@@ -48,10 +54,18 @@ lazy_loader detection
 
 import argparse
 import ast
+import hashlib
 import importlib
+import importlib.util
+import os
+import pickle
 import pkgutil
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from importlib.metadata import PackageNotFoundError, version as _pkg_version
 from pathlib import Path
+from typing import Iterator
 
 
 # ---------------------------------------------------------------------------
@@ -59,258 +73,435 @@ from pathlib import Path
 # ---------------------------------------------------------------------------
 
 LARGE_THRESHOLD = 500   # lines; modules above this get [LARGE] tag
+COUNT_WORKERS = min(32, (os.cpu_count() or 1) * 4)   # threads for line counting
+
+
+# ---------------------------------------------------------------------------
+# Warnings — collected while mapping, written to stderr in one go
+# ---------------------------------------------------------------------------
+
+_WARNINGS: list[str] = []
+
+
+def _warn(msg: str) -> None:
+    _WARNINGS.append(f'[warn] {msg}')
+
+
+def _flush_warnings() -> None:
+    if _WARNINGS:
+        sys.stderr.write('\n'.join(_WARNINGS) + '\n')
+        sys.stderr.flush()
+        _WARNINGS.clear()
 
 
 # ---------------------------------------------------------------------------
 # AST helpers for __init__.py analysis
 # ---------------------------------------------------------------------------
 
-def _ast_parse_safe(path: Path) -> ast.Module | None:
+# Bump when the cached payload changes shape.
+CACHE_VERSION = '1'
+
+
+def _ast_cache_path(cache_dir: str, data: bytes) -> str:
+    # AST node classes and fields differ between Python minor versions.
+    h = hashlib.sha256(
+        f'{CACHE_VERSION}|{sys.version_info[0]}.{sys.version_info[1]}|'.encode()
+    )
+    h.update(data)
+    return os.path.join(cache_dir, h.hexdigest()[:16] + '.pkl')
+
+
+def _load_cached_tree(cache_path: str) -> ast.Module | None:
     try:
-        src = path.read_text(encoding='utf-8', errors='replace')
-        return ast.parse(src, filename=str(path))
-    except SyntaxError as e:
-        print(f'[warn] AST parse failed for {path}: {e}', file=sys.stderr)
+        with open(cache_path, 'rb') as f:
+            tree = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ValueError):
         return None
+    return tree if isinstance(tree, ast.Module) else None
+
+
+def _store_cached_tree(cache_path: str, tree: ast.Module) -> None:
+    tmp_path = f'{cache_path}.{os.getpid()}.tmp'
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(tree, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+def _ast_parse_safe(path: Path, cache_dir: str | None = None) -> ast.Module | None:
+    try:
+        data = path.read_bytes()
     except OSError as e:
-        print(f'[warn] Cannot read {path}: {e}', file=sys.stderr)
+        _warn(f'Cannot read {path}: {e}')
+        return None
+
+    cache_path = None
+    if cache_dir is not None:
+        cache_path = _ast_cache_path(cache_dir, data)
+        tree = _load_cached_tree(cache_path)
+        if tree is not None:
+            return tree
+
+    # Same text as read_text(encoding='utf-8', errors='replace').
+    src = data.decode('utf-8', errors='replace')
+    if '\r' in src:
+        src = src.replace('\r\n', '\n').replace('\r', '\n')
+    try:
+        tree = ast.parse(src, filename=str(path))
+    except SyntaxError as e:
+        _warn(f'AST parse failed for {path}: {e}')
         return None
 
+    if cache_path is not None:
+        _store_cached_tree(cache_path, tree)
+    return tree
+
 
-def _extract_init_info(init_path: Path) -> dict:
+def _str_elts(node: ast.expr) -> list[str]:
+    """String constants of a list/tuple literal, e.g. ['foo', 'bar']."""
+    if isinstance(node, (ast.List, ast.Tuple)):
+        return [
+            elt.value
+            for elt in node.elts
+            if isinstance(elt, ast.Constant) and isinstance(elt.value, str)
+        ]
+    return []
+
+
+# Compound statements whose blocks run at import time and are searched.
+# Everything else — class and function bodies, loops, expressions below
+# the statement level — is pruned.
+_BLOCK_FIELDS = {
+    ast.If: ('body', 'orelse'),
+    ast.Try: ('body', 'orelse', 'finalbody'),
+    ast.With: ('body',),
+}
+if hasattr(ast, 'TryStar'):  # Python 3.11+
+    _BLOCK_FIELDS[ast.TryStar] = ('body', 'orelse', 'finalbody')
+
+
+def _iter_init_statements(body: list[ast.stmt]) -> Iterator[ast.stmt]:
+    """Source-order statements of body, descending only into _BLOCK_FIELDS."""
+    for stmt in body:
+        fields = _BLOCK_FIELDS.get(type(stmt))
+        if fields is None:
+            yield stmt
+            continue
+        for field in fields:
+            yield from _iter_init_statements(getattr(stmt, field))
+        for handler in getattr(stmt, 'handlers', ()):
+            yield from _iter_init_statements(handler.body)
+
+
+class _InitCollector(ast.NodeVisitor):
     """
-    Returns a dict with keys:
-        eager_star_imports   : list[str]   — 'from .sub import *'
-        eager_named_imports  : list[str]   — 'from .sub import Foo, Bar'
-        lazy_getattr_keys    : list[str]   — string keys in __getattr__
-        all_list             : list[str]   — __all__ contents
-        version              : str | None  — __version__ value
-        top_level_imports    : list[str]   — 'import X' or 'from X import Y' (non-relative)
-        lazy_loader_mode     : bool        — True if lazy_loader.attach_stub detected
-        stub_file            : str | None  — path to __init__.pyi if found
-        stub_symbols         : list[str]   — symbols parsed from .pyi stub
+    One source-order pass over the statements of an __init__ module that run
+    at import time (see _iter_init_statements).  Function bodies are not
+    eager; only a module-level __getattr__ is inspected, for lazy keys.
     """
-    info = {
-        'eager_star_imports': [],
-        'eager_named_imports': [],
-        'lazy_getattr_keys': [],
-        'all_list': [],
-        'version': None,
-        'top_level_imports': [],
-        'lazy_loader_mode': False,
-        'stub_file': None,
-        'stub_symbols': [],
-    }
 
-    tree = _ast_parse_safe(init_path)
-    if tree is None:
-        return info
+    def __init__(self) -> None:
+        self.eager_star_imports: list[str] = []
+        self.eager_named_imports: list[str] = []
+        # dicts as insertion-ordered sets
+        self.lazy_getattr_keys: dict[str, None] = {}
+        self.top_level_imports: dict[str, None] = {}
+        self.version: str | None = None
+        self.lazy_loader_detected = False
+        # __all__ contributions by source; the report lists plain assignment
+        # first, then augmented assignment, then .extend() calls.
+        self._all_assign: list[str] = []
+        self._all_extra: list[str] = []
+        self._all_extend: list[str] = []
+
+    def results(self) -> dict:
+        # Plain assignments are kept verbatim; later sources only add new names.
+        all_list = self._all_assign
+        seen = set(all_list)
+        for name in self._all_extra + self._all_extend:
+            if name not in seen:
+                seen.add(name)
+                all_list.append(name)
+        return {
+            'eager_star_imports': self.eager_star_imports,
+            'eager_named_imports': self.eager_named_imports,
+            'lazy_getattr_keys': list(self.lazy_getattr_keys),
+            'all_list': all_list,
+            'version': self.version,
+            'top_level_imports': list(self.top_level_imports),
+        }
+
+    def visit_Module(self, node: ast.Module) -> None:
+        for stmt in _iter_init_statements(node.body):
+            self.visit(stmt)
+
+    def generic_visit(self, node: ast.AST) -> None:
+        # Pruned: nothing below an unhandled node is inspected.
+        return
+
+    def _add_top(self, name: str) -> None:
+        self.top_level_imports[name.split('.')[0]] = None
+
+    def visit_Import(self, node: ast.Import) -> None:
+        # top-level absolute imports (dependency hints)
+        for alias in node.names:
+            self._add_top(alias.name)
 
-    for node in ast.walk(tree):
+    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
         # from .sub import *
-        if isinstance(node, ast.ImportFrom) and node.names[0].name == '*':
+        if node.names[0].name == '*':
             module = node.module or ''
             prefix = '.' * (node.level or 0)
-            info['eager_star_imports'].append(f'{prefix}{module}')
-
+            self.eager_star_imports.append(f'{prefix}{module}')
         # from .sub import Foo, Bar  (non-star relative)
-        elif isinstance(node, ast.ImportFrom) and node.level and node.level > 0:
+        elif node.level and node.level > 0:
             module = node.module or ''
             prefix = '.' * node.level
             names = ', '.join(a.name for a in node.names)
-            info['eager_named_imports'].append(f'{prefix}{module} → {names}')
-
-        # top-level absolute imports (dependency hints)
-        elif isinstance(node, ast.Import):
-            for alias in node.names:
-                top = alias.name.split('.')[0]
-                if top not in info['top_level_imports']:
-                    info['top_level_imports'].append(top)
-        elif isinstance(node, ast.ImportFrom) and (node.level == 0):
-            if node.module:
-                top = node.module.split('.')[0]
-                if top not in info['top_level_imports']:
-                    info['top_level_imports'].append(top)
-
-    # __all__ assignment
-    for node in ast.walk(tree):
-        if (
-            isinstance(node, ast.Assign)
-            and any(
-                isinstance(t, ast.Name) and t.id == '__all__'
-                for t in node.targets
-            )
-        ):
-            if isinstance(node.value, (ast.List, ast.Tuple)):
-                for elt in node.value.elts:
-                    if isinstance(elt, ast.Constant) and isinstance(elt.value, str):
-                        info['all_list'].append(elt.value)
-
-    # __all__ augmented assignment: __all__ += ['foo', 'bar']
-    for node in ast.walk(tree):
-        if (
-            isinstance(node, ast.AugAssign)
-            and isinstance(node.target, ast.Name)
-            and node.target.id == '__all__'
-            and isinstance(node.value, (ast.List, ast.Tuple))
-        ):
-            for elt in node.value.elts:
-                if isinstance(elt, ast.Constant) and isinstance(elt.value, str):
-                    if elt.value not in info['all_list']:
-                        info['all_list'].append(elt.value)
-    # __all__.extend(['foo', 'bar'])
-    for node in ast.walk(tree):
+            self.eager_named_imports.append(f'{prefix}{module} → {names}')
+        elif node.level == 0 and node.module:
+            self._add_top(node.module)
+
+    def visit_Assign(self, node: ast.Assign) -> None:
+        for t in node.targets:
+            if isinstance(t, ast.Name) and t.id == '__all__':
+                self._all_assign.extend(_str_elts(node.value))
+                break
+        for t in node.targets:
+            if (
+                isinstance(t, ast.Name)
+                and t.id == '__version__'
+                and isinstance(node.value, ast.Constant)
+            ):
+                self.version = str(node.value.value)
+                break
+        # __getattr__, __dir__, __all__ = lazy.attach_stub(__name__, __file__)
+        if _is_attach_stub_call(node.value):
+            self.lazy_loader_detected = True
+
+    def visit_AugAssign(self, node: ast.AugAssign) -> None:
+        # __all__ += ['foo', 'bar']
+        if isinstance(node.target, ast.Name) and node.target.id == '__all__':
+            self._all_extra.extend(_str_elts(node.value))
+
+    def visit_Expr(self, node: ast.Expr) -> None:
+        if isinstance(node.value, ast.Call):
+            self.visit_Call(node.value)
+
+    def visit_Call(self, node: ast.Call) -> None:
+        func = node.func
+        # __all__.extend(['foo', 'bar'])
         if (
-            isinstance(node, ast.Call)
-            and isinstance(node.func, ast.Attribute)
-            and isinstance(node.func.value, ast.Name)
-            and node.func.value.id == '__all__'
-            and node.func.attr == 'extend'
+            isinstance(func, ast.Attribute)
+            and isinstance(func.value, ast.Name)
+            and func.value.id == '__all__'
+            and func.attr == 'extend'
             and node.args
-            and isinstance(node.args[0], (ast.List, ast.Tuple))
         ):
-            for elt in node.args[0].elts:
-                if isinstance(elt, ast.Constant) and isinstance(elt.value, str):
-                    if elt.value not in info['all_list']:
-                        info['all_list'].append(elt.value)
+            self._all_extend.extend(_str_elts(node.args[0]))
+        elif _is_attach_stub_call(node):
+            self.lazy_loader_detected = True
+
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
+        if node.name != '__getattr__':
+            return
+        # Module-level __getattr__ — collect string keys (subscript or compare).
+        # Its body only runs on attribute access, so nothing else is eager.
+        for child in ast.walk(node):
+            # dict keys like _LAZY_MAP = {'key': ...}  or  if name == 'key':
+            if isinstance(child, ast.Constant) and isinstance(child.value, str):
+                key = child.value
+                if key and not key.startswith('_'):
+                    self.lazy_getattr_keys[key] = None
+
+
+def _is_attach_stub_call(node: ast.AST) -> bool:
+    if not isinstance(node, ast.Call):
+        return False
+    func = node.func
+    # lazy_loader.attach_stub(...) or a directly imported attach_stub(...)
+    return (isinstance(func, ast.Attribute) and func.attr == 'attach_stub') or (
+        isinstance(func, ast.Name) and func.id == 'attach_stub'
+    )
 
-    # __version__ assignment
-    for node in ast.walk(tree):
-        if (
-            isinstance(node, ast.Assign)
-            and any(
-                isinstance(t, ast.Name) and t.id == '__version__'
-                for t in node.targets
-            )
-            and isinstance(node.value, ast.Constant)
-        ):
-            info['version'] = str(node.value.value)
 
-    # __getattr__ function — collect string keys (subscript or compare)
-    for node in ast.walk(tree):
-        if isinstance(node, ast.FunctionDef) and node.name == '__getattr__':
-            for child in ast.walk(node):
-                # dict keys like _LAZY_MAP = {'key': ...}  or  if name == 'key':
-                if isinstance(child, ast.Constant) and isinstance(child.value, str):
-                    key = child.value
-                    if key and not key.startswith('_'):
-                        if key not in info['lazy_getattr_keys']:
-                            info['lazy_getattr_keys'].append(key)
+def _has_top_level_attach_stub(tree: ast.Module) -> bool:
+    """Cheap check of module-level statements, e.g.
+    __getattr__, __dir__, __all__ = lazy.attach_stub(__name__, __file__)"""
+    return any(
+        isinstance(stmt, (ast.Expr, ast.Assign)) and _is_attach_stub_call(stmt.value)
+        for stmt in tree.body
+    )
+
+
+def _empty_init_info() -> dict:
+    return {
+        'eager_star_imports': [],
+        'eager_named_imports': [],
+        'lazy_getattr_keys': [],
+        'all_list': [],
+        'version': None,
+        'top_level_imports': [],
+        'lazy_loader_mode': False,
+        'stub_file': None,
+        'stub_symbols': [],
+    }
 
-    # ------------------------------------------------------------------
-    # lazy_loader detection
-    # Detect calls matching:  lazy_loader.attach_stub(...) or attach_stub(...)
-    # where the function name / attribute is 'attach_stub'.
-    # ------------------------------------------------------------------
-    lazy_loader_detected = False
-    for node in ast.walk(tree):
-        if isinstance(node, ast.Call):
-            func = node.func
-            # lazy_loader.attach_stub(...)
-            if isinstance(func, ast.Attribute) and func.attr == 'attach_stub':
-                lazy_loader_detected = True
-                break
-            # attach_stub(...)  — in case imported directly
-            if isinstance(func, ast.Name) and func.id == 'attach_stub':
-                lazy_loader_detected = True
-                break
+
+def _extract_init_info(init_path: Path, cache_dir: str | None = None) -> dict:
+    """
+    Returns a dict with keys:
+        eager_star_imports   : list[str]   — 'from .sub import *'
+        eager_named_imports  : list[str]   — 'from .sub import Foo, Bar'
+        lazy_getattr_keys    : list[str]   — string keys in __getattr__
+        all_list             : list[str]   — __all__ contents
+        version              : str | None  — __version__ value
+        top_level_imports    : list[str]   — 'import X' or 'from X import Y' (non-relative)
+        lazy_loader_mode     : bool        — True if lazy_loader.attach_stub detected
+        stub_file            : str | None  — path to __init__.pyi if found
+        stub_symbols         : list[str]   — symbols parsed from .pyi stub
+    """
+    info = _empty_init_info()
+
+    tree = _ast_parse_safe(init_path, cache_dir)
+    if tree is None:
+        return info
+
+    collector = _InitCollector()
+    if _has_top_level_attach_stub(tree):
+        # The stub is the source of truth; only the version and dependency
+        # hints still come from __init__.py, so skip everything nested.
+        for stmt in tree.body:
+            if isinstance(stmt, (ast.Import, ast.ImportFrom, ast.Assign)):
+                collector.visit(stmt)
+        lazy_loader_detected = True
+    else:
+        collector.visit(tree)
+        lazy_loader_detected = collector.lazy_loader_detected
+    info.update(collector.results())
 
     if lazy_loader_detected:
         info['lazy_loader_mode'] = True
         stub_path = init_path.with_suffix('.pyi')  # __init__.pyi
         if stub_path.exists():
             info['stub_file'] = str(stub_path)
-            info['stub_symbols'] = _extract_pyi_symbols(stub_path)
+            info['stub_symbols'], stub_all = _extract_pyi_info(stub_path, cache_dir)
             # Also pull __all__ from stub if not already populated
             if not info['all_list']:
-                info['all_list'] = _extract_pyi_all(stub_path)
+                info['all_list'] = stub_all
         else:
-            print(
-                f'[warn] lazy_loader detected in {init_path} but no .pyi stub found '
-                f'at {stub_path}',
-                file=sys.stderr,
+            _warn(
+                f'lazy_loader detected in {init_path} but no .pyi stub found '
+                f'at {stub_path}'
             )
 
     return info
 
 
-def _extract_pyi_symbols(pyi_path: Path) -> list[str]:
+def _extract_pyi_info(
+    pyi_path: Path, cache_dir: str | None = None
+) -> tuple[list[str], list[str]]:
     """
-    Parse a .pyi stub file (valid Python AST) and return all imported symbol
-    names — both from 'from .sub import Foo, Bar' and 'import X' statements.
-    These represent the lazy-loaded public API declared by lazy_loader.attach_stub.
+    Parse a .pyi stub file (valid Python AST) once and return
+    (symbols, all_list):
+      symbols  — all imported symbol names, both from 'from .sub import Foo, Bar'
+                 and 'import X' statements.  These represent the lazy-loaded
+                 public API declared by lazy_loader.attach_stub.
+      all_list — the first __all__ list/tuple assigned in the stub.
     """
-    tree = _ast_parse_safe(pyi_path)
+    # ast.parse runs in C; a tokenize-based scan of an import-only stub is
+    # ~5x slower on CPython 3.11, so stubs go through the AST as well.
+    tree = _ast_parse_safe(pyi_path, cache_dir)
     if tree is None:
-        return []
+        return [], []
 
-    symbols: list[str] = []
+    symbols: set[str] = set()
+    all_list: list[str] | None = None
     for node in ast.walk(tree):
         if isinstance(node, ast.ImportFrom):
             for alias in node.names:
                 name = alias.asname if alias.asname else alias.name
                 if name and name != '*' and not name.startswith('_'):
-                    if name not in symbols:
-                        symbols.append(name)
+                    symbols.add(name)
         elif isinstance(node, ast.Import):
             for alias in node.names:
                 name = alias.asname if alias.asname else alias.name.split('.')[0]
                 if name and not name.startswith('_'):
-                    if name not in symbols:
-                        symbols.append(name)
-    return sorted(symbols)
-
-
-def _extract_pyi_all(pyi_path: Path) -> list[str]:
-    """Extract __all__ list from a .pyi stub file."""
-    tree = _ast_parse_safe(pyi_path)
-    if tree is None:
-        return []
-
-    for node in ast.walk(tree):
-        if (
-            isinstance(node, ast.Assign)
+                    symbols.add(name)
+        elif (
+            all_list is None
+            and isinstance(node, ast.Assign)
+            and isinstance(node.value, (ast.List, ast.Tuple))
             and any(
                 isinstance(t, ast.Name) and t.id == '__all__'
                 for t in node.targets
             )
         ):
-            if isinstance(node.value, (ast.List, ast.Tuple)):
-                return [
-                    elt.value
-                    for elt in node.value.elts
-                    if isinstance(elt, ast.Constant) and isinstance(elt.value, str)
-                ]
-    return []
+            all_list = _str_elts(node.value)
+    return sorted(symbols), all_list or []
 
 
 # ---------------------------------------------------------------------------
 # Line counter
 # ---------------------------------------------------------------------------
 
-def _count_lines(path: Path) -> int:
+def _count_lines(path: str | Path) -> int:
     try:
-        return len(path.read_bytes().splitlines())
+        with open(path, 'rb') as f:
+            data = f.read()
     except OSError:
         return 0
+    # bytes.splitlines() also breaks on a lone \r; only pay for the list then.
+    if b'\r' in data:
+        return len(data.splitlines())
+    return data.count(b'\n') + (1 if data and data[-1:] != b'\n' else 0)
 
 
 # ---------------------------------------------------------------------------
 # Module inventory — source tree mode
 # ---------------------------------------------------------------------------
 
+def _iter_py_files(root: str) -> Iterator[str]:
+    # Like Path.rglob('*.py'), but reuses scandir's d_type instead of stat().
+    stack = [root]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith('.py') and entry.is_file():
+                    yield entry.path
+
+
 def _inventory_from_source(pkg_root: Path) -> list[dict]:
     """Walk filesystem for .py files under pkg_root."""
     entries = []
-    for py_file in sorted(pkg_root.rglob('*.py')):
-        rel = py_file.relative_to(pkg_root.parent)
-        # Convert path to dotted module name
-        parts = list(rel.with_suffix('').parts)
-        dotted = '.'.join(parts)
-        lines = _count_lines(py_file)
+    # Sort by path components to keep Path ordering (foo/__init__.py < foo.py).
+    py_paths = sorted(_iter_py_files(str(pkg_root)), key=lambda p: p.split(os.sep))
+    # read() releases the GIL, so threads overlap the per-file I/O.
+    if len(py_paths) > 1 and COUNT_WORKERS > 1:
+        with ThreadPoolExecutor(max_workers=COUNT_WORKERS) as pool:
+            line_counts = list(pool.map(_count_lines, py_paths))
+    else:
+        line_counts = list(map(_count_lines, py_paths))
+    base = os.path.join(str(pkg_root.parent), '')
+    base_len = len(base)
+    for py_file, lines in zip(py_paths, line_counts):
+        rel = py_file[base_len:]
         entries.append({
-            'module': dotted,
-            'path': str(py_file.relative_to(pkg_root.parent)),
+            # Convert path to dotted module name
+            'module': rel[:-3].replace(os.sep, '.'),
+            'path': rel,
             'lines': lines,
             'large': lines >= LARGE_THRESHOLD,
         })
@@ -321,32 +512,49 @@ def _inventory_from_source(pkg_root: Path) -> list[dict]:
 # Module inventory — installed package mode
 # ---------------------------------------------------------------------------
 
+def _walk_package_specs(
+    search_path: list[str], prefix: str, seen: set[str] | None = None
+) -> Iterator[tuple[str, str | None]]:
+    """
+    Yield (modname, origin) in pkgutil.walk_packages order, but descend into
+    subpackages through their spec's search locations instead of importing.
+    """
+    if seen is None:
+        seen = set()
+    for importer, modname, ispkg in pkgutil.iter_modules(search_path, prefix):
+        # Attempt to find source file without importing
+        try:
+            spec = importer.find_spec(modname)  # type: ignore[union-attr]
+        except Exception:
+            spec = None
+        yield modname, spec.origin if spec else None
+
+        if ispkg and spec and spec.submodule_search_locations:
+            sub_path = [p for p in spec.submodule_search_locations if p not in seen]
+            seen.update(sub_path)
+            if sub_path:
+                yield from _walk_package_specs(sub_path, modname + '.', seen)
+
+
 def _inventory_from_package(pkg_name: str) -> tuple[list[dict], str | None]:
-    """Use pkgutil.walk_packages to enumerate installed package."""
+    """Locate an installed package with find_spec and walk it without importing."""
     try:
-        pkg = importlib.import_module(pkg_name)
-    except ImportError as e:
+        spec = importlib.util.find_spec(pkg_name)
+    except (ImportError, ValueError) as e:
         print(f'[error] Cannot import {pkg_name}: {e}', file=sys.stderr)
         sys.exit(1)
+    if spec is None:
+        print(f'[error] Cannot import {pkg_name}: No module named {pkg_name!r}',
+              file=sys.stderr)
+        sys.exit(1)
 
-    pkg_path = getattr(pkg, '__path__', None)
-    pkg_file = getattr(pkg, '__file__', None)
+    pkg_path = spec.submodule_search_locations
+    pkg_file = spec.origin if spec.has_location else None
     location = str(Path(pkg_file).parent) if pkg_file else None
 
     entries = []
     if pkg_path:
-        for importer, modname, ispkg in pkgutil.walk_packages(
-            path=pkg_path,
-            prefix=pkg_name + '.',
-            onerror=lambda x: None,
-        ):
-            # Attempt to find source file without importing
-            try:
-                spec = importer.find_spec(modname)  # type: ignore[union-attr]
-                src = spec.origin if spec else None
-            except Exception:
-                src = None
-
+        for modname, src in _walk_package_specs(list(pkg_path), pkg_name + '.'):
             lines = _count_lines(Path(src)) if src and Path(src).exists() else 0
             entries.append({
                 'module': modname,
@@ -358,6 +566,15 @@ def _inventory_from_package(pkg_name: str) -> tuple[list[dict], str | None]:
     return entries, location
 
 
+@lru_cache(maxsize=None)
+def _dist_version(pkg_name: str) -> str | None:
+    """Installed distribution version, read from metadata without importing."""
+    try:
+        return _pkg_version(pkg_name)
+    except PackageNotFoundError:
+        return None
+
+
 # ---------------------------------------------------------------------------
 # Markdown renderer
 # ---------------------------------------------------------------------------
@@ -482,6 +699,88 @@ def _render_markdown(
     return '\n'.join(lines)
 
 
+# ---------------------------------------------------------------------------
+# Library entry points
+# ---------------------------------------------------------------------------
+
+def _init_info_or_warn(init_path: Path, cache_dir: str | None) -> dict:
+    if init_path.exists():
+        return _extract_init_info(init_path, cache_dir)
+    _warn(
+        f'No __init__.py at {init_path} — package may be a namespace package, '
+        f'use src/ layout, or rely on implicit namespace. Module map will be incomplete.'
+    )
+    return _empty_init_info()
+
+
+def collect_module_map(
+    pkg_name: str | None = None,
+    source: str | Path | None = None,
+    cache_dir: str | None = None,
+) -> dict:
+    """
+    Gather everything the module map shows for an installed package
+    (pkg_name) or a local source tree (source).  Returns the keyword
+    arguments of _render_markdown: pkg_name, version, location, init_info,
+    inventory.  Like the CLI, exits on an unknown package or directory.
+    """
+    try:
+        if source:
+            pkg_root = Path(source).resolve()
+            if not pkg_root.is_dir():
+                print(f'[error] Source directory not found: {pkg_root}', file=sys.stderr)
+                sys.exit(1)
+            pkg_name = pkg_root.name
+            location = str(pkg_root)
+            init_info = _init_info_or_warn(pkg_root / '__init__.py', cache_dir)
+            version = init_info.get('version')
+            inventory = _inventory_from_source(pkg_root)
+
+        elif pkg_name:
+            inventory, location = _inventory_from_package(pkg_name)
+
+            # Try to find __init__.py in the reported location
+            if location:
+                init_info = _init_info_or_warn(Path(location) / '__init__.py', cache_dir)
+            else:
+                init_info = _empty_init_info()
+            version = init_info.get('version')
+            # Also try importlib for version
+            if not version:
+                version = _dist_version(pkg_name)
+
+        else:
+            raise ValueError('collect_module_map() needs pkg_name or source')
+
+        return {
+            'pkg_name': pkg_name,
+            'version': version,
+            'location': location,
+            'init_info': init_info,
+            'inventory': inventory,
+        }
+    finally:
+        _flush_warnings()
+
+
+def build_module_map(
+    pkg_name: str | None = None,
+    source: str | Path | None = None,
+    output: str | Path | None = None,
+    cache_dir: str | None = None,
+) -> str:
+    """
+    Return the module map markdown, also writing it to output if given.
+    Batch callers can map many packages in one process this way.
+    """
+    md = _render_markdown(**collect_module_map(pkg_name, source, cache_dir))
+    if output is not None:
+        output_path = Path(output)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_text(md, encoding='utf-8')
+    return md
+
+
 # ---------------------------------------------------------------------------
 # Entry point
 # ---------------------------------------------------------------------------
@@ -503,79 +802,31 @@ def main():
         '--output', default='assets/module-map.md',
         help='Output markdown file (default: assets/module-map.md)'
     )
+    parser.add_argument(
+        '--cache-dir', default='.cache/module-map',
+        help='Parsed __init__ AST cache (default: .cache/module-map)'
+    )
+    parser.add_argument(
+        '--no-cache', action='store_true',
+        help='Re-parse __init__.py / .pyi and do not touch the cache'
+    )
     args = parser.parse_args()
 
     output_path = Path(args.output)
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # ------------------------------------------------------------------
-    if args.source:
-        pkg_root = Path(args.source).resolve()
-        if not pkg_root.is_dir():
-            print(f'[error] Source directory not found: {pkg_root}', file=sys.stderr)
-            sys.exit(1)
-        pkg_name = pkg_root.name
-        init_path = pkg_root / '__init__.py'
-        location = str(pkg_root)
-
-        if init_path.exists():
-            init_info = _extract_init_info(init_path)
-        else:
-            print(
-                f'[warn] No __init__.py at {init_path} — package may be a namespace package, '
-                f'use src/ layout, or rely on implicit namespace. Module map will be incomplete.',
-                file=sys.stderr,
-            )
-            init_info = {
-                'eager_star_imports': [], 'eager_named_imports': [],
-                'lazy_getattr_keys': [], 'all_list': [],
-                'version': None, 'top_level_imports': [],
-                'lazy_loader_mode': False, 'stub_file': None, 'stub_symbols': [],
-            }
-        version = init_info.get('version')
-        inventory = _inventory_from_source(pkg_root)
-
-    else:  # --package
-        pkg_name = args.package
-        inventory, location = _inventory_from_package(pkg_name)
-
-        # Try to find __init__.py in the reported location
-        if location:
-            init_path = Path(location) / '__init__.py'
-            if init_path.exists():
-                init_info = _extract_init_info(init_path)
-            else:
-                print(
-                    f'[warn] No __init__.py at {init_path} — package may be a namespace package, '
-                    f'use src/ layout, or rely on implicit namespace. Module map will be incomplete.',
-                    file=sys.stderr,
-                )
-                init_info = {
-                    'eager_star_imports': [], 'eager_named_imports': [],
-                    'lazy_getattr_keys': [], 'all_list': [],
-                    'version': None, 'top_level_imports': [],
-                    'lazy_loader_mode': False, 'stub_file': None, 'stub_symbols': [],
-                }
-        else:
-            init_info = {
-                'eager_star_imports': [], 'eager_named_imports': [],
-                'lazy_getattr_keys': [], 'all_list': [],
-                'version': None, 'top_level_imports': [],
-                'lazy_loader_mode': False, 'stub_file': None, 'stub_symbols': [],
-            }
-        version = init_info.get('version')
-        # Also try importlib for version
-        if not version:
-            try:
-                import importlib.metadata
-                version = importlib.metadata.version(pkg_name)
-            except Exception:
-                pass
-
-    # ------------------------------------------------------------------
-    md = _render_markdown(pkg_name, version, location, init_info, inventory)
+    module_map = collect_module_map(
+        pkg_name=args.package,
+        source=args.source,
+        cache_dir=None if args.no_cache else args.cache_dir,
+    )
+    md = _render_markdown(**module_map)
     output_path.write_text(md, encoding='utf-8')
 
+    pkg_name = module_map['pkg_name']
+    version = module_map['version']
+    init_info = module_map['init_info']
+    inventory = module_map['inventory']
     print(f'Package  : {pkg_name}')
     print(f'Version  : {version or "unknown"}')
     if init_info.get('lazy_loader_mode'):
@@ -13,17 +13,67 @@ Usage:
     python verify-snippets.py --root <library-skill-dir>
     python verify-snippets.py --root <library-skill-dir> --fail-fast
     python verify-snippets.py --root <library-skill-dir> --timeout 45
+    python verify-snippets.py --root <library-skill-dir> --jobs 4   # parallel
+    python verify-snippets.py --root <library-skill-dir> --in-process
+    python verify-snippets.py --root <library-skill-dir> --reuse-workers
+    python verify-snippets.py --root <library-skill-dir> --cache
+
+Every snippet runs by default.  --cache answers a snippet that passed
+before from .cache/snippet-results (under the working directory, never
+inside the delivered skill) when nothing in its key changed: snippet text,
+interpreter, versions of the installed distributions it imports, and the
+size/mtime of every non-markdown file under <root>.  Imports made through
+importlib or files read from outside <root> are not tracked, so the final
+verification run should be made without --cache.
+
+Snippets run one at a time in source order by default, so a snippet may
+rely on files written by an earlier one.  --jobs N runs N at once (in no
+fixed order, slowest first) and is only safe when every snippet is
+independent of the others.
+
+--in-process skips the per-snippet interpreter startup by exec()ing each
+snippet in this process (sequentially, with a SIGALRM timeout on POSIX).
+Snippets then share sys.modules and process state, so prefer the default
+subprocess mode for final verification.  os._exit(n) in an exec()ed
+snippet raises SystemExit(n) instead of ending the verifier (so the snippet
+itself could catch it); a crash or signal that kills the process still ends
+an --in-process run.  --reuse-workers is the middle
+ground: --jobs long-lived worker interpreters take snippets one at a time
+(fresh namespace each, shared sys.modules per worker); a timed-out or
+crashed worker is killed and replaced.
 """
 
 from __future__ import annotations
 
 import argparse
+import ast
+import contextlib
+import hashlib
+import io
+import itertools
+import json
+import os
+import queue
+import re
+import signal
 import subprocess
 import sys
+import threading
 import time
+import traceback
+import types
+from collections import Counter, deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import cached_property, lru_cache, partial
+from importlib.metadata import (
+    PackageNotFoundError,
+    packages_distributions,
+    version as _pkg_version,
+)
 from pathlib import Path
+from typing import Iterator
 
 
 PYTHON_FENCE_LANGS = {"python", "py", "python3"}
@@ -34,6 +84,12 @@ class Snippet:
     file_path: Path
     start_line: int
     code: str
+    rel_path: str  # file_path relative to the skill root, for display
+
+    @cached_property
+    def code_obj(self) -> types.CodeType:
+        """Compiled once per snippet; named <string> to match `python -c`."""
+        return compile(self.code, "<string>", "exec")
 
 
 @dataclass
@@ -44,6 +100,178 @@ class SnippetResult:
     returncode: int | None
     stdout: str
     stderr: str
+    cached: bool = False
+
+    @cached_property
+    def error_summary(self) -> str:
+        """short_error(stderr), shared by the console line and the report."""
+        return short_error(self.stderr)
+
+
+# Bump when the cached payload or the way snippets are run changes.
+CACHE_VERSION = "2"
+CACHE_MAX_ENTRIES = 4096
+# Characters kept from each end of a subprocess snippet's stdout/stderr.
+CAPTURE_LIMIT = 64 * 1024
+
+
+@lru_cache(maxsize=None)
+def _module_distributions() -> dict[str, list[str]]:
+    return packages_distributions()
+
+
+@lru_cache(maxsize=None)
+def _dist_version(dist: str) -> str:
+    try:
+        return _pkg_version(dist)
+    except PackageNotFoundError:
+        return "?"
+
+
+@lru_cache(maxsize=None)
+def imported_distributions(code: str) -> tuple[str, ...]:
+    """
+    "name==version" of each installed distribution providing a module the
+    snippet imports, so upgrading a library invalidates its cached results.
+    """
+    try:
+        tree = ast.parse(code)
+    except SyntaxError:
+        return ()
+    modules: set[str] = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            modules.update(alias.name.partition(".")[0] for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.level == 0 and node.module:
+            modules.add(node.module.partition(".")[0])
+    dists = {d for m in modules for d in _module_distributions().get(m, ())}
+    return tuple(sorted(f"{d}=={_dist_version(d)}" for d in dists))
+
+
+def skill_fingerprint(root: Path, exclude: set[Path]) -> str:
+    """
+    Digest of the size and mtime of every file under root a snippet might
+    import or read.  Markdown (snippet text is keyed already), hidden
+    directories, __pycache__ and the exclude paths are skipped.
+    """
+    excluded = {str(p) for p in exclude}
+    h = hashlib.sha256()
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(
+            d
+            for d in dirnames
+            if not d.startswith(".")
+            and d != "__pycache__"
+            and os.path.join(dirpath, d) not in excluded
+        )
+        for name in sorted(filenames):
+            path = os.path.join(dirpath, name)
+            if name.endswith(".md") or path in excluded:
+                continue
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            rel = os.path.relpath(path, root)
+            h.update(f"{rel}|{st.st_size}|{st.st_mtime_ns}\n".encode())
+    return h.hexdigest()
+
+
+def _cache_path(cache_dir: Path, snippet: Snippet, salt: str) -> Path:
+    # Same code on another interpreter or platform may behave differently.
+    h = hashlib.sha256(
+        f"{CACHE_VERSION}|{sys.version}|{sys.executable}|{sys.platform}|".encode()
+    )
+    h.update(f"{salt}|{','.join(imported_distributions(snippet.code))}|".encode())
+    h.update(snippet.code.encode("utf-8"))
+    return cache_dir / (h.hexdigest()[:24] + ".json")
+
+
+def load_cached_result(
+    cache_dir: Path, snippet: Snippet, salt: str
+) -> SnippetResult | None:
+    path = _cache_path(cache_dir, snippet, salt)
+    try:
+        payload = json.loads(path.read_bytes())
+        os.utime(path)  # recently used entries survive prune_cache
+        return SnippetResult(
+            snippet=snippet,
+            status=payload["status"],
+            duration_sec=payload["duration_sec"],
+            returncode=payload["returncode"],
+            stdout=payload["stdout"],
+            stderr=payload["stderr"],
+            cached=True,
+        )
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def load_cached_pass(
+    cache_dir: Path | None, snippet: Snippet, salt: str
+) -> SnippetResult | None:
+    """The cached result for snippet if it passed last time, else None."""
+    if cache_dir is None:
+        return None
+    hit = load_cached_result(cache_dir, snippet, salt)
+    return hit if hit is not None and hit.status == "pass" else None
+
+
+def store_cached_result(cache_dir: Path, result: SnippetResult, salt: str) -> None:
+    """
+    Remember a result.  Only passes are answered from the cache; failures
+    and timeouts are always re-run, and their entry just records how long
+    they took for schedule_key().
+    """
+    path = _cache_path(cache_dir, result.snippet, salt)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    payload = {
+        "status": result.status,
+        "duration_sec": result.duration_sec,
+        "returncode": result.returncode,
+        "stdout": result.stdout,
+        "stderr": result.stderr,
+    }
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_text(json.dumps(payload), encoding="utf-8")
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+def schedule_key(snippet: Snippet, previous: SnippetResult | None) -> tuple:
+    """
+    Sort key for longest-first dispatch: snippets never timed before come
+    first (largest code first), then by last known duration, descending.
+    """
+    if previous is None:
+        return (0, -len(snippet.code))
+    return (1, -previous.duration_sec)
+
+
+def prune_cache(cache_dir: Path, max_entries: int = CACHE_MAX_ENTRIES) -> None:
+    """Keep the max_entries most recently used cache entries."""
+    try:
+        with os.scandir(cache_dir) as it:
+            entries = [
+                (entry.stat().st_mtime, entry.path)
+                for entry in it
+                if entry.name.endswith(".json") and entry.is_file()
+            ]
+    except OSError:
+        return
+    if len(entries) <= max_entries:
+        return
+    entries.sort(reverse=True)
+    for _, path in entries[max_entries:]:
+        try:
+            os.remove(path)
+        except OSError:
+            continue
 
 
 def collect_markdown_files(root: Path) -> list[Path]:
@@ -53,21 +281,59 @@ def collect_markdown_files(root: Path) -> list[Path]:
 
     files = [skill_md]
     ref_dir = root / "references"
-    if ref_dir.exists():
-        files.extend(sorted(ref_dir.glob("*.md")))
+    # One directory read; DirEntry.is_file() answers from the dirent type
+    # without a stat() except for symlinks, which are followed.
+    try:
+        with os.scandir(ref_dir) as entries:
+            names = [e.name for e in entries if e.name.endswith(".md") and e.is_file()]
+    except (FileNotFoundError, NotADirectoryError):
+        names = []
+    files.extend(ref_dir / name for name in sorted(names))
     return files
 
 
-def extract_python_snippets(md_path: Path) -> list[Snippet]:
-    snippets: list[Snippet] = []
-    lines = md_path.read_text(encoding="utf-8", errors="replace").splitlines()
+def iter_markdown_lines(text: str) -> Iterator[str]:
+    """
+    Lazily yield the lines of text with exactly the breaks of
+    text.splitlines(), without building the whole list: universal newlines
+    split on \\n, \\r and \\r\\n, and splitlines() on each piece adds the
+    rarer breaks (\\f, \\x1c, U+2028, ...).
+    """
+    for raw in io.StringIO(text, newline=None):
+        yield from raw.splitlines()
+
+
+# Necessary condition for a python fence opener: ``` + whitespace + "py"
+# (case-insensitive, as fence_lang is lowercased).  Fence-free or non-python
+# files are rejected by this one C-level search.
+_PY_FENCE_HINT_RE = re.compile(r"```\s*py", re.IGNORECASE)
+
+
+# One fenced block per match: an opener line (any indentation) up to the next
+# line that starts with ``` after its own indentation.  ^ and $ only honour
+# "\n", so this is only used when the text has no other splitlines() breaks.
+FENCE_RE = re.compile(r"^[^\S\n]*```([^\n]*)\n(.*?)^[^\S\n]*```", re.M | re.S)
+_EXOTIC_BREAK_RE = re.compile("[\v\f\x1c\x1d\x1e\x85\u2028\u2029]")
+
+
+def _python_fences_by_regex(text: str) -> Iterator[tuple[int, str]]:
+    pos = 0
+    lineno = 1
+    for m in FENCE_RE.finditer(text):
+        if m.group(1).strip().lower() not in PYTHON_FENCE_LANGS:
+            continue
+        lineno += text.count("\n", pos, m.start(2))
+        pos = m.start(2)
+        yield lineno, m.group(2).strip()
+
 
+def _python_fences_by_line(text: str) -> Iterator[tuple[int, str]]:
     in_fence = False
     fence_lang = ""
     fence_start = 0
     buffer: list[str] = []
 
-    for lineno, line in enumerate(lines, start=1):
+    for lineno, line in enumerate(iter_markdown_lines(text), start=1):
         stripped = line.strip()
 
         if not in_fence:
@@ -80,11 +346,7 @@ def extract_python_snippets(md_path: Path) -> list[Snippet]:
 
         if stripped.startswith("```"):
             if fence_lang in PYTHON_FENCE_LANGS:
-                code = "\n".join(buffer).strip()
-                if code:
-                    snippets.append(
-                        Snippet(file_path=md_path, start_line=fence_start, code=code)
-                    )
+                yield fence_start, "\n".join(buffer).strip()
             in_fence = False
             fence_lang = ""
             buffer = []
@@ -92,30 +354,124 @@ def extract_python_snippets(md_path: Path) -> list[Snippet]:
 
         buffer.append(line)
 
-    return snippets
 
+def extract_python_snippets(md_path: Path, root: Path) -> list[Snippet]:
+    text = md_path.read_text(encoding="utf-8", errors="replace")
+    if not _PY_FENCE_HINT_RE.search(text):
+        return []
+
+    if _EXOTIC_BREAK_RE.search(text):
+        fences = _python_fences_by_line(text)
+    else:
+        fences = _python_fences_by_regex(text)
+    rel_path = str(md_path.relative_to(root))
+    return [
+        Snippet(file_path=md_path, start_line=start_line, code=code, rel_path=rel_path)
+        for start_line, code in fences
+        if code
+    ]
+
+
+# Snippets must not leave __pycache__ directories behind in the repository:
+# subprocess and worker interpreters get this environment, and in-process
+# runs set sys.dont_write_bytecode (see _exec_snippet_code).
+SNIPPET_ENV = {**os.environ, "PYTHONDONTWRITEBYTECODE": "1"}
+
+
+class _BoundedCapture:
+    """
+    Drain a text pipe on a daemon thread, keeping only the first and last
+    CAPTURE_LIMIT characters, so a snippet that prints without end costs
+    bounded memory.  Output under the limit is kept verbatim.
+    """
+
+    def __init__(self, stream) -> None:
+        self._stream = stream
+        self._head: list[str] = []
+        self._head_len = 0
+        self._tail: deque[str] = deque()
+        self._tail_len = 0
+        self._dropped = 0
+        self._error: BaseException | None = None
+        self._thread = threading.Thread(target=self._pump, daemon=True)
+        self._thread.start()
+
+    def _pump(self) -> None:
+        try:
+            with self._stream:
+                while chunk := self._stream.read(8192):
+                    self._add(chunk)
+        except BaseException as exc:  # surfaced by getvalue()
+            self._error = exc
 
-def run_snippet(snippet: Snippet, cwd: Path, timeout_sec: float) -> SnippetResult:
+    def _add(self, chunk: str) -> None:
+        if self._head_len < CAPTURE_LIMIT:
+            take = chunk[: CAPTURE_LIMIT - self._head_len]
+            self._head.append(take)
+            self._head_len += len(take)
+            chunk = chunk[len(take) :]
+            if not chunk:
+                return
+        self._tail.append(chunk)
+        self._tail_len += len(chunk)
+        while self._tail_len - len(self._tail[0]) >= CAPTURE_LIMIT:
+            dropped = self._tail.popleft()
+            self._tail_len -= len(dropped)
+            self._dropped += len(dropped)
+
+    def join(self, timeout: float | None) -> bool:
+        """Wait for EOF; return False if the pipe is still open."""
+        self._thread.join(timeout)
+        return not self._thread.is_alive()
+
+    def getvalue(self) -> str:
+        if self._error is not None:
+            raise self._error
+        head = "".join(self._head)
+        tail = "".join(self._tail)
+        if not self._dropped:
+            return head + tail
+        return f"{head}\n... [{self._dropped} characters truncated] ...\n{tail}"
+
+
+def run_snippet(
+    snippet: Snippet,
+    cwd: Path,
+    timeout_sec: float,
+    python_flags: tuple[str, ...] = (),
+) -> SnippetResult:
     started = time.perf_counter()
+    # close_fds=False skips closing every fd in the child; only fds that
+    # are explicitly inheritable (none, by default since PEP 446) leak.
+    proc = subprocess.Popen(
+        [sys.executable, *python_flags, "-c", snippet.code],
+        cwd=str(cwd),
+        env=SNIPPET_ENV,
+        close_fds=False,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    stdout = _BoundedCapture(proc.stdout)
+    stderr = _BoundedCapture(proc.stderr)
+
+    deadline = started + timeout_sec
     try:
-        proc = subprocess.run(
-            [sys.executable, "-c", snippet.code],
-            cwd=str(cwd),
-            capture_output=True,
-            text=True,
-            timeout=timeout_sec,
-        )
-    except subprocess.TimeoutExpired as exc:
-        duration = time.perf_counter() - started
-        stdout = exc.stdout if isinstance(exc.stdout, str) else ""
-        stderr = exc.stderr if isinstance(exc.stderr, str) else ""
+        proc.wait(timeout=timeout_sec)
+        # A background child may still hold the pipes open past exit.
+        for capture in (stdout, stderr):
+            if not capture.join(max(0.0, deadline - time.perf_counter())):
+                raise subprocess.TimeoutExpired(proc.args, timeout_sec)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
         return SnippetResult(
             snippet=snippet,
             status="timeout",
-            duration_sec=duration,
+            duration_sec=time.perf_counter() - started,
             returncode=None,
-            stdout=stdout,
-            stderr=stderr,
+            stdout="",
+            stderr="",
         )
 
     duration = time.perf_counter() - started
@@ -125,16 +481,322 @@ def run_snippet(snippet: Snippet, cwd: Path, timeout_sec: float) -> SnippetResul
         status=status,
         duration_sec=duration,
         returncode=proc.returncode,
-        stdout=proc.stdout,
-        stderr=proc.stderr,
+        stdout=stdout.getvalue(),
+        stderr=stderr.getvalue(),
+    )
+
+
+class _SnippetTimeout(BaseException):
+    """Raised inside an in-process snippet when its time budget runs out."""
+
+
+def _raise_timeout(signum, frame):
+    raise _SnippetTimeout()
+
+
+def _exit_stub(real_exit, owner_pid: int):
+    """
+    os._exit replacement for exec()ed snippets: in the verifier's own
+    process it raises SystemExit so the run goes on; forked children (e.g.
+    multiprocessing workers started by the snippet) still exit for real.
+    """
+
+    def _exit(code: int) -> None:
+        if os.getpid() != owner_pid:
+            real_exit(code)
+        raise SystemExit(code)
+
+    return _exit
+
+
+def _exec_snippet_code(
+    source: str | types.CodeType,
+    cwd: Path,
+    stdout: io.StringIO,
+    stderr: io.StringIO,
+) -> int:
+    """
+    exec() one snippet (text, or a code object compiled as <string>) here as
+    `python -c` would run it (cwd, argv, sys.path[0], fresh __main__
+    namespace) and return its exit code.  Output and
+    tracebacks go to the given buffers.  _SnippetTimeout propagates.
+    Modules the snippet imports are not written back as .pyc files, and
+    os._exit(n) ends only the snippet, with exit code n.
+    """
+    saved_argv, saved_path0, saved_cwd = sys.argv, sys.path[0], os.getcwd()
+    saved_dont_write, saved_os_exit = sys.dont_write_bytecode, os._exit
+    returncode = 0
+    try:
+        os.chdir(cwd)
+        sys.argv, sys.path[0] = ["-c"], ""
+        sys.dont_write_bytecode = True
+        os._exit = _exit_stub(saved_os_exit, os.getpid())
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            try:
+                if isinstance(source, str):
+                    source = compile(source, "<string>", "exec")
+                exec(source, {"__name__": "__main__", "__builtins__": __builtins__})
+            except SystemExit as exc:
+                if exc.code is None or isinstance(exc.code, int):
+                    returncode = exc.code or 0
+                else:
+                    print(exc.code, file=sys.stderr)
+                    returncode = 1
+            except _SnippetTimeout:
+                raise
+            except BaseException as exc:
+                # Drop this function's frame so the trace starts at <string>.
+                tb = exc.__traceback__.tb_next if exc.__traceback__ else None
+                if isinstance(exc, SyntaxError):
+                    tb = None
+                traceback.print_exception(type(exc), exc, tb, file=sys.stderr)
+                returncode = 1
+    finally:
+        sys.argv, sys.path[0] = saved_argv, saved_path0
+        sys.dont_write_bytecode = saved_dont_write
+        os._exit = saved_os_exit
+        os.chdir(saved_cwd)
+    return returncode
+
+
+def run_snippet_inproc(
+    snippet: Snippet, cwd: Path, timeout_sec: float
+) -> SnippetResult:
+    """
+    Like run_snippet, but exec() the code in this interpreter.  Exit codes
+    and tracebacks follow `python -c`.  Must run on the main thread; the
+    timeout needs SIGALRM and is not enforced where that is unavailable.
+    """
+    stdout, stderr = io.StringIO(), io.StringIO()
+    use_alarm = (
+        hasattr(signal, "setitimer")
+        and threading.current_thread() is threading.main_thread()
+    )
+    old_handler = None
+    status, returncode = "pass", 0
+
+    started = time.perf_counter()
+    try:
+        if use_alarm:
+            old_handler = signal.signal(signal.SIGALRM, _raise_timeout)
+            signal.setitimer(signal.ITIMER_REAL, timeout_sec)
+        try:
+            source: str | types.CodeType = snippet.code_obj
+        except SyntaxError:
+            # Not cached; compiling again below reports it like python -c.
+            source = snippet.code
+        returncode = _exec_snippet_code(source, cwd, stdout, stderr)
+    except _SnippetTimeout:
+        status, returncode = "timeout", None
+    finally:
+        if use_alarm:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, old_handler)
+    duration = time.perf_counter() - started
+
+    if status == "pass" and returncode != 0:
+        status = "fail"
+    return SnippetResult(
+        snippet=snippet,
+        status=status,
+        duration_sec=duration,
+        returncode=returncode,
+        stdout=stdout.getvalue(),
+        stderr=stderr.getvalue(),
     )
 
 
+WORKER_FLAG = "--worker"
+
+
+def _worker_main() -> None:
+    """
+    Persistent snippet worker (this script run with WORKER_FLAG).  Reads one
+    JSON request per line on stdin and answers with one JSON line on stdout.
+    The protocol uses private copies of fds 0/1; the snippet's own stdin
+    and fd-level stdout point at os.devnull so they cannot corrupt it.
+    """
+    requests = os.fdopen(os.dup(0), "r", encoding="utf-8")
+    replies = os.fdopen(os.dup(1), "w", encoding="utf-8")
+    devnull = os.open(os.devnull, os.O_RDWR)
+    os.dup2(devnull, 0)
+    os.dup2(devnull, 1)
+    sys.stdin = open(os.devnull, encoding="utf-8")
+
+    for line in requests:
+        request = json.loads(line)
+        stdout, stderr = io.StringIO(), io.StringIO()
+        returncode = _exec_snippet_code(
+            request["code"], Path(request["cwd"]), stdout, stderr
+        )
+        replies.write(
+            json.dumps(
+                {
+                    "returncode": returncode,
+                    "stdout": stdout.getvalue(),
+                    "stderr": stderr.getvalue(),
+                }
+            )
+            + "\n"
+        )
+        replies.flush()
+
+
+class WorkerPool:
+    """
+    Long-lived worker interpreters, so N snippets cost K interpreter
+    startups instead of N.  Thread-safe: each run() checks a worker out of
+    the idle queue.  A worker that times out or dies is discarded and a
+    fresh one is spawned on demand.  Snippets on the same worker share
+    sys.modules (each still gets a fresh namespace).
+
+    With pin_cpus (Linux only), each worker is bound to its own CPU from
+    this process's affinity mask, and a replacement inherits the CPU of
+    the worker it replaces.  Workers beyond the number of CPUs run unpinned.
+    """
+
+    def __init__(
+        self, python_flags: tuple[str, ...] = (), pin_cpus: bool = False
+    ) -> None:
+        self._python_flags = python_flags
+        self._idle: queue.SimpleQueue[subprocess.Popen] = queue.SimpleQueue()
+        self._procs: list[subprocess.Popen] = []
+        self._lock = threading.Lock()
+        self._free_cpus: list[int] = []
+        if pin_cpus and hasattr(os, "sched_setaffinity"):
+            self._free_cpus = sorted(os.sched_getaffinity(0))
+        self._cpu_of: dict[subprocess.Popen, int] = {}
+
+    def _spawn(self) -> subprocess.Popen:
+        proc = subprocess.Popen(
+            [
+                sys.executable,
+                *self._python_flags,
+                os.path.abspath(__file__),
+                WORKER_FLAG,
+            ],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            env=SNIPPET_ENV,
+            text=True,
+            encoding="utf-8",
+        )
+        with self._lock:
+            self._procs.append(proc)
+            if self._free_cpus:
+                cpu = self._free_cpus.pop(0)
+                try:
+                    os.sched_setaffinity(proc.pid, {cpu})
+                    self._cpu_of[proc] = cpu
+                except OSError:
+                    self._free_cpus.insert(0, cpu)
+        return proc
+
+    def _acquire(self) -> subprocess.Popen:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            return self._spawn()
+
+    def run(self, snippet: Snippet, cwd: Path, timeout_sec: float) -> SnippetResult:
+        proc = self._acquire()
+        timed_out = threading.Event()
+
+        def kill() -> None:
+            timed_out.set()
+            proc.kill()
+
+        started = time.perf_counter()
+        timer = threading.Timer(timeout_sec, kill)
+        timer.start()
+        try:
+            assert proc.stdin is not None and proc.stdout is not None
+            proc.stdin.write(json.dumps({"code": snippet.code, "cwd": str(cwd)}) + "\n")
+            proc.stdin.flush()
+            line = proc.stdout.readline()
+        except OSError:
+            line = ""
+        finally:
+            timer.cancel()
+        duration = time.perf_counter() - started
+
+        if line:
+            reply = json.loads(line)
+            if timed_out.is_set():
+                self._retire(proc)
+            else:
+                self._idle.put(proc)
+            returncode = reply["returncode"]
+            return SnippetResult(
+                snippet=snippet,
+                status="pass" if returncode == 0 else "fail",
+                duration_sec=duration,
+                returncode=returncode,
+                stdout=reply["stdout"],
+                stderr=reply["stderr"],
+            )
+
+        # No reply: killed by the timer, or the snippet took the worker down
+        # (os._exit, a crash in an extension module, ...).
+        self._retire(proc)
+        if timed_out.is_set():
+            return SnippetResult(
+                snippet=snippet,
+                status="timeout",
+                duration_sec=duration,
+                returncode=None,
+                stdout="",
+                stderr="",
+            )
+        return SnippetResult(
+            snippet=snippet,
+            status="fail",
+            duration_sec=duration,
+            returncode=proc.returncode,
+            stdout="",
+            stderr="",
+        )
+
+    def _retire(self, proc: subprocess.Popen) -> None:
+        proc.kill()
+        proc.wait()
+        with self._lock:
+            if proc in self._procs:
+                self._procs.remove(proc)
+            if proc in self._cpu_of:
+                self._free_cpus.insert(0, self._cpu_of.pop(proc))
+
+    def close(self) -> None:
+        with self._lock:
+            procs, self._procs = self._procs, []
+        for proc in procs:
+            if proc.stdin is not None:
+                try:
+                    proc.stdin.close()
+                except OSError:
+                    pass
+        for proc in procs:
+            try:
+                proc.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                proc.wait()
+            if proc.stdout is not None:
+                proc.stdout.close()
+
+
 def short_error(text: str, max_lines: int = 4) -> str:
-    lines = [ln for ln in text.strip().splitlines() if ln.strip()]
+    # Only the first max_lines + 1 non-blank lines matter, so stop there
+    # rather than splitting all of a long stderr.  Stripping the first and
+    # last kept line equals stripping the text up front.
+    nonblank = (ln for ln in iter_markdown_lines(text) if ln.strip())
+    lines = list(itertools.islice(nonblank, max_lines + 1))
     if not lines:
         return "(no stderr)"
+    lines[0] = lines[0].lstrip()
     if len(lines) <= max_lines:
+        lines[-1] = lines[-1].rstrip()
         return " | ".join(lines)
     return " | ".join(lines[:max_lines]) + " | ..."
 
@@ -145,9 +807,7 @@ def render_report(
     report_path.parent.mkdir(parents=True, exist_ok=True)
     now = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%SZ")
 
-    passed = sum(1 for r in results if r.status == "pass")
-    failed = sum(1 for r in results if r.status == "fail")
-    timed_out = sum(1 for r in results if r.status == "timeout")
+    counts = Counter(r.status for r in results)
 
     lines: list[str] = []
     lines.append("# Snippet Verification Report")
@@ -155,23 +815,22 @@ def render_report(
     lines.append(f"- Generated: `{now}`")
     lines.append(f"- Root: `{root}`")
     lines.append(f"- Total snippets: `{total_snippets}`")
-    lines.append(f"- Passed: `{passed}`")
-    lines.append(f"- Failed: `{failed}`")
-    lines.append(f"- Timed out: `{timed_out}`")
+    lines.append(f"- Passed: `{counts['pass']}`")
+    lines.append(f"- Failed: `{counts['fail']}`")
+    lines.append(f"- Timed out: `{counts['timeout']}`")
     lines.append("")
     lines.append("| Status | Location | Duration (s) | Details |")
     lines.append("|--------|----------|--------------|---------|")
 
     for result in results:
-        rel = result.snippet.file_path.relative_to(root)
-        loc = f"`{rel}:{result.snippet.start_line}`"
+        loc = f"`{result.snippet.rel_path}:{result.snippet.start_line}`"
         duration = f"{result.duration_sec:.2f}"
         if result.status == "pass":
             details = "ok"
         elif result.status == "timeout":
             details = "timeout"
         else:
-            details = short_error(result.stderr)
+            details = result.error_summary
         lines.append(f"| {result.status} | {loc} | {duration} | {details} |")
 
     report_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
@@ -197,6 +856,48 @@ def main() -> None:
         action="store_true",
         help="Stop immediately on first failed or timed-out snippet",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Snippets to run concurrently (default: 1, in source order); "
+        "values above 1 require snippets that do not depend on each other",
+    )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Skip snippets that passed before and are unchanged (see --cache-dir); "
+        "off by default so every run executes every snippet",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=".cache/snippet-results",
+        help="Result cache used by --cache (default: .cache/snippet-results)",
+    )
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument(
+        "--in-process",
+        action="store_true",
+        help="exec() snippets in this interpreter instead of a subprocess each "
+        "(faster, less isolated, always sequential)",
+    )
+    mode.add_argument(
+        "--reuse-workers",
+        action="store_true",
+        help="Run snippets in --jobs persistent worker interpreters instead of "
+        "one fresh interpreter per snippet (faster; workers share sys.modules)",
+    )
+    parser.add_argument(
+        "--pin-workers",
+        action="store_true",
+        help="With --reuse-workers, bind each worker to its own CPU (Linux)",
+    )
+    parser.add_argument(
+        "--no-site",
+        action="store_true",
+        help="Start snippet interpreters with -S (skip site.py; faster startup, "
+        "but site-packages such as numpy are not importable)",
+    )
     parser.add_argument(
         "--report",
         default="assets/snippet-verification.md",
@@ -215,9 +916,15 @@ def main() -> None:
         print(f"ERROR: {exc}", file=sys.stderr)
         sys.exit(1)
 
-    snippets: list[Snippet] = []
-    for md_file in md_files:
-        snippets.extend(extract_python_snippets(md_file))
+    # Reads overlap on slow or network storage; map() keeps file order.
+    if len(md_files) > 1:
+        with ThreadPoolExecutor(max_workers=min(16, len(md_files))) as tp:
+            per_file = list(
+                tp.map(partial(extract_python_snippets, root=root), md_files)
+            )
+    else:
+        per_file = [extract_python_snippets(md_file, root) for md_file in md_files]
+    snippets: list[Snippet] = list(itertools.chain.from_iterable(per_file))
 
     if not snippets:
         print("ERROR: no fenced Python snippets found.", file=sys.stderr)
@@ -227,20 +934,95 @@ def main() -> None:
     print(f"Markdown   : {len(md_files)} files")
     print(f"Snippets   : {len(snippets)}")
     print(f"Timeout    : {args.timeout:.1f}s")
+    if args.in_process:
+        print("Jobs       : 1 (in-process)")
+    else:
+        print(f"Jobs       : {max(1, args.jobs)}")
     print()
 
     results: list[SnippetResult] = []
     failures = 0
 
-    for idx, snippet in enumerate(snippets, start=1):
-        rel = snippet.file_path.relative_to(root)
-        result = run_snippet(snippet, cwd=root, timeout_sec=args.timeout)
+    # Interpreter flags for subprocess and worker runs; in-process runs
+    # start no interpreter.
+    python_flags = ("-S",) if args.no_site and not args.in_process else ()
+    if args.in_process:
+        mode = "inproc"
+    elif args.reuse_workers:
+        mode = "workers"
+    else:
+        mode = "subprocess"
+    cache_dir: Path | None = None
+    salt = ""
+    if args.cache:
+        cache_dir = Path(args.cache_dir)
+        # A snippet that passes with site-packages may fail under -S, and one
+        # that passes next to the verifier's (or a worker's) sys.modules may
+        # fail in a fresh interpreter.
+        fingerprint = skill_fingerprint(root, {cache_dir.resolve()})
+        salt = f"{mode}|{' '.join(python_flags)}|{fingerprint}"
+    # Unchanged snippets that passed before are answered from the cache and
+    # never reach a runner.
+    pool: ThreadPoolExecutor | None = None
+    workers: WorkerPool | None = None
+    if args.in_process:
+        # Sequential, so each snippet is looked up only when reached: after a
+        # --fail-fast stop, no later cache entry is read.
+        outcomes = (
+            load_cached_pass(cache_dir, snippet, salt)
+            or run_snippet_inproc(snippet, root, args.timeout)
+            for snippet in snippets
+        )
+    else:
+        jobs = max(1, args.jobs)
+        runner = partial(run_snippet, python_flags=python_flags)
+        if args.reuse_workers:
+            workers = WorkerPool(python_flags, pin_cpus=args.pin_workers)
+            runner = workers.run
+        if jobs == 1:
+            # Run each snippet only once the previous result has been
+            # reported, so --fail-fast stops before the next one starts.
+            outcomes = (
+                load_cached_pass(cache_dir, snippet, salt)
+                or runner(snippet, root, args.timeout)
+                for snippet in snippets
+            )
+        else:
+            previous: list[SnippetResult | None] = [
+                load_cached_result(cache_dir, snippet, salt)
+                if cache_dir is not None
+                else None
+                for snippet in snippets
+            ]
+            cached = [
+                r if r is not None and r.status == "pass" else None for r in previous
+            ]
+            # Each worker thread just waits on its child interpreter, so
+            # threads are enough.  Results are reported in snippet order
+            # regardless of finish order.
+            pool = ThreadPoolExecutor(max_workers=jobs)
+            # A slow snippet dispatched last keeps one worker busy while the
+            # rest idle, so start the slowest ones first.
+            pending = [i for i, hit in enumerate(cached) if hit is None]
+            pending.sort(key=lambda i: schedule_key(snippets[i], previous[i]))
+            futures: list[Future | None] = [None] * len(snippets)
+            for i in pending:
+                futures[i] = pool.submit(runner, snippets[i], root, args.timeout)
+            outcomes = (
+                hit or future.result() for hit, future in zip(cached, futures)
+            )
+
+    for idx, (snippet, result) in enumerate(zip(snippets, outcomes), start=1):
+        rel = snippet.rel_path
         results.append(result)
+        if cache_dir is not None and not result.cached:
+            store_cached_result(cache_dir, result, salt)
 
         if result.status == "pass":
+            note = ", cached" if result.cached else ""
             print(
                 f"PASS [{idx}/{len(snippets)}] {rel}:{snippet.start_line} "
-                f"({result.duration_sec:.2f}s)"
+                f"({result.duration_sec:.2f}s{note})"
             )
             continue
 
@@ -251,7 +1033,7 @@ def main() -> None:
                 f"({result.duration_sec:.2f}s)"
             )
         else:
-            err = short_error(result.stderr)
+            err = result.error_summary
             code = result.returncode if result.returncode is not None else "?"
             print(
                 f"FAIL [{idx}/{len(snippets)}] {rel}:{snippet.start_line} "
@@ -260,8 +1042,18 @@ def main() -> None:
             print(f"  stderr: {err}")
 
         if args.fail_fast:
+            # Queued snippets never start; ones already running are discarded.
+            if pool is not None:
+                pool.shutdown(wait=True, cancel_futures=True)
             break
 
+    if pool is not None:
+        pool.shutdown()
+    if workers is not None:
+        workers.close()
+    if cache_dir is not None:
+        prune_cache(cache_dir)
+
     if args.report != "-":
         report_path = Path(args.report)
         if not report_path.is_absolute():
@@ -270,16 +1062,20 @@ def main() -> None:
         print()
         print(f"Report     : {report_path}")
 
-    passed = sum(1 for r in results if r.status == "pass")
-    failed = sum(1 for r in results if r.status == "fail")
-    timed_out = sum(1 for r in results if r.status == "timeout")
+    counts = Counter(r.status for r in results)
 
     print()
-    print(f"Summary: {passed} passed, {failed} failed, {timed_out} timed out")
+    print(
+        f"Summary: {counts['pass']} passed, {counts['fail']} failed, "
+        f"{counts['timeout']} timed out"
+    )
 
     if failures > 0:
         sys.exit(1)
 
 
 if __name__ == "__main__":
-    main()
+    if sys.argv[1:] == [WORKER_FLAG]:
+        _worker_main()
+    else:
+        main()